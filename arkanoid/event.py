@@ -1,4 +1,3 @@
-from collections import defaultdict
 import logging
 
 import pygame
@@ -15,24 +14,27 @@ class EventReceiver:
     """
 
     def __init__(self):
-        # Map of event types to handlers.
-        self._handlers = defaultdict(list)
+        # Map of event types to handlers. The handlers are held in tuples,
+        # which are replaced rather than modified when handlers are added or
+        # removed, so a handler can safely (un)register handlers while
+        # receive() is iterating over them.
+        self._handlers = {}
 
     def receive(self):
         """Receive the latest list of pygame events (if any) and dispatch them
         to any registered handlers.
         """
         event_list = pygame.event.get()
+        handlers = self._handlers
+
+        if not handlers:
+            # Nothing is listening, but the events still need to be taken
+            # off the queue.
+            return
 
         for event in event_list:
-            try:
-                handlers = self._handlers[event.type]
-            except KeyError:
-                # No handlers registered for this event.
-                pass
-            else:
-                for handler in handlers:
-                    handler(event)
+            for handler in handlers.get(event.type, ()):
+                handler(event)
 
     def register_handler(self, event_type, *handlers):
         """Register one or more event handlers for the given event type.
@@ -48,7 +50,8 @@ class EventReceiver:
         """
         assert len(handlers) > 0
         LOG.debug('Registering event handler: %s=%s', event_type, handlers)
-        self._handlers[event_type] += handlers
+        existing = self._handlers.get(event_type, ())
+        self._handlers[event_type] = existing + handlers
 
     def unregister_handler(self, *handlers):
         """Unregisters one or more event handlers so that they will no longer
@@ -59,12 +62,18 @@ class EventReceiver:
                 One or more event handlers to unregister.
         """
         assert len(handlers) > 0
-        for event_type, evt_handlers in self._handlers.items():
-            for h in list(evt_handlers):
-                if h in handlers:
-                    LOG.debug('Unregistering event handler: %s', h)
-                    evt_handlers.remove(h)
+        LOG.debug('Unregistering event handlers: %s', handlers)
+        to_remove = set(handlers)
+
+        for event_type, evt_handlers in list(self._handlers.items()):
+            evt_handlers = tuple(h for h in evt_handlers
+                                 if h not in to_remove)
+            self._handlers[event_type] = evt_handlers
+            if not evt_handlers:
+                # Only keep the event types that something is listening for,
+                # so that receive() can skip the rest with a single lookup.
+                del self._handlers[event_type]
 
 
-# The singleton EventDispatcher instance.
+# The singleton EventReceiver instance.
 receiver = EventReceiver()
@@ -1,4 +1,3 @@
-import functools
 import importlib
 import itertools
 import logging
@@ -24,8 +23,14 @@ LOG = logging.getLogger(__name__)
 
 # The speed the game runs at in FPS.
 GAME_SPEED = 60
+# The most steps of game logic that are run for a single frame, when the
+# game is catching up after frames have been dropped.
+MAX_LOGIC_STEPS = 4
 # The dimensions of the main game window in pixels.
 DISPLAY_SIZE = 600, 800
+# When the areas of the screen that have changed add up to more than this
+# many pixels, the whole display is updated in one go instead.
+FULL_UPDATE_AREA = DISPLAY_SIZE[0] * DISPLAY_SIZE[1] // 2
 # The number of pixels from the top of the screen before the top edge starts.
 TOP_OFFSET = 150
 # The title of the main window.
@@ -52,20 +57,60 @@ MAIN_FONT = os.path.join(os.path.dirname(__file__), 'data', 'fonts',
                          'generation.ttf')
 ALT_FONT = os.path.join(os.path.dirname(__file__), 'data', 'fonts',
                         'optimus.otf')
+# The keys for the digits 0-9, which are numbered consecutively.
+NUMERIC_KEYS = range(pygame.K_0, pygame.K_9 + 1)
 
-# Initialise the pygame modules.
-pygame.init()
+
+def logic_steps(lag):
+    """Work out how many steps of game logic to run for a frame.
+
+    Normally there's one step for each frame. More are run when the last
+    frame took too long, but no more than MAX_LOGIC_STEPS, so that the game
+    doesn't jump ahead after a long pause.
+
+    Args:
+        lag:
+            The time in milliseconds that has passed but has yet to be run
+            as a step.
+    Returns:
+        A 2-tuple of the number of steps to run and the lag that remains
+        once they've been run.
+    """
+    step_time = 1000 / GAME_SPEED
+    steps = min(max(round(lag / step_time), 1), MAX_LOGIC_STEPS)
+    return steps, min(max(lag - steps * step_time, 0), step_time)
 
 
 class Arkanoid:
     """Manages the overall program. This will start and end new games."""
 
+    __slots__ = ('_clock', '_screen', '_background', '_high_score',
+                 '_start_screen', '_game', '_running', '_scores_displayed',
+                 '_score_surf', '_exposed')
+
     def __init__(self):
+        # Initialise just the pygame modules that the game uses. Sound and
+        # joysticks aren't, so there's no need to start them up.
+        pygame.display.init()
+        pygame.font.init()
+
+        if not getattr(pygame, 'IS_CE', False):
+            # Only pygame-ce is supported (see requirements.txt). The original
+            # pygame lacks some of its APIs and its faster blitting routines.
+            LOG.warning('Running on pygame %s rather than pygame-ce, '
+                        'which is not supported', pygame.version.ver)
+
         # Initialise the clock.
         self._clock = pygame.time.Clock()
 
         # Create the main screen (the window) and default background.
         self._screen = self._create_screen()
+
+        # Only let through the events that the game handles, so that others
+        # (e.g. mouse motion) don't have to be processed every frame.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                                  pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED])
         self._background = self._create_background()
         self._display_logo()
         self._display_score_titles()
@@ -85,11 +130,23 @@ class Arkanoid:
             self._running = False
         receiver.register_handler(pygame.QUIT, quit_handler)
 
-        # Initialise the scores.
-        self._display_player_score = functools.partial(self._display_score,
-                                                       y=35)
-        self._display_high_score = functools.partial(self._display_score,
-                                                     y=100)
+        # Whether the window needs to be redrawn in full, because the window
+        # system has discarded some of its contents (e.g. when it was
+        # uncovered).
+        self._exposed = False
+
+        def expose_handler(event):
+            self._exposed = True
+        receiver.register_handler(pygame.VIDEOEXPOSE, expose_handler)
+        receiver.register_handler(pygame.WINDOWEXPOSED, expose_handler)
+
+        # Initialise the scores. The value currently displayed by each score
+        # is kept, keyed by its vertical position, so that a score is only
+        # redrawn when it changes.
+        self._scores_displayed = {}
+        # The surface the score text is rendered to, which is reused for
+        # each score.
+        self._score_surf = pygame.Surface((150, 20)).convert_alpha()
         self._display_player_score(0)
         self._display_high_score(self._high_score)
 
@@ -99,28 +156,69 @@ class Arkanoid:
 
         Pretty much everything takes place within this loop.
         """
+        # Look these up once, rather than on every frame.
+        tick, receive = self._clock.tick, receiver.receive
+        flip, update = pygame.display.flip, pygame.display.update
+
+        # The game logic runs in fixed steps, GAME_SPEED times a second. The
+        # time that has passed but has yet to be run as a step is kept, so
+        # that the game doesn't slow down when frames are dropped.
+        lag = 0
+
         while self._running:
             # Game runs at 60 fps.
-            self._clock.tick(GAME_SPEED)
+            lag += tick(GAME_SPEED)
 
             # Receive and dispatch events.
-            receiver.receive()
+            receive()
 
             if not self._game:
                 self._start_screen.show()
-            else:
-                self._game.update()
-                self._display_player_score(self._game.score)
 
-                if self._game.over:
-                    if self._game.score > self._high_score:
-                        self._high_score = self._game.score
-                        self._display_high_score(self._high_score)
+                # Display all updates.
+                flip()
+                self._exposed = False
+
+                # There's nothing to catch up on when a game starts.
+                lag = 0
+            else:
+                steps, lag = logic_steps(lag)
+
+                game = self._game
+                round_ = game.round
+                game.update(steps)
+                score_rect = self._display_player_score(game.score)
+                if score_rect:
+                    game.dirty_rects.append(score_rect)
+
+                if game.over:
+                    if game.score > self._high_score:
+                        self._high_score = game.score
+                        game.dirty_rects.append(
+                            self._display_high_score(self._high_score))
                         save_high_score(self._high_score)
                     self._game = None
 
-            # Display all updates.
-            pygame.display.flip()
+                # Only display the areas of the screen that have changed,
+                # if any have. When most of the screen has changed (e.g. at
+                # the start of a round) it's cheaper to display all of it,
+                # and all of it has to be displayed after the window has
+                # been exposed.
+                dirty_rects = game.dirty_rects
+                if self._exposed or sum(
+                        rect.w * rect.h
+                        for rect in dirty_rects) > FULL_UPDATE_AREA:
+                    flip()
+                    self._exposed = False
+                elif dirty_rects:
+                    update(dirty_rects)
+                dirty_rects.clear()
+
+                if game.round is not round_:
+                    # The time taken to load the next round isn't caught up
+                    # on, so restart the clock.
+                    tick()
+                    lag = 0
 
         LOG.debug('Exiting')
 
@@ -143,6 +241,8 @@ class Arkanoid:
         else:
             self._game = Game(round_class=round_cls)
             self._start_screen.hide()
+            # The time taken to create the game isn't caught up on.
+            self._clock.tick()
 
     def _create_screen(self):
         pygame.display.set_mode(DISPLAY_SIZE)
@@ -171,8 +271,31 @@ class Arkanoid:
                    fontsize=24,
                    color=(230, 0, 0))
 
+    def _display_player_score(self, value):
+        return self._display_score(value, 35)
+
+    def _display_high_score(self, value):
+        return self._display_score(value, 100)
+
     def _display_score(self, value, y):
-        score_surf = pygame.Surface((150, 20)).convert_alpha()
+        """Display a score at the given vertical position, if it is not
+        already displayed.
+
+        Args:
+            value:
+                The score to display.
+            y:
+                The vertical position of the score on the screen.
+        Returns:
+            The Rect the score was drawn to, or None if the score was
+            already displayed and so was not redrawn.
+        """
+        if self._scores_displayed.get(y) == value:
+            return None
+        self._scores_displayed[y] = value
+
+        score_surf = self._score_surf
+        score_surf.fill((0, 0, 0))
         ptext.draw(str(value),
                    topright=(150, 0),
                    fontname=MAIN_FONT,
@@ -181,7 +304,7 @@ class Arkanoid:
                    surf=score_surf)
         position = self._screen.get_width() - 160, y
         self._screen.blit(self._background, position, score_surf.get_rect())
-        self._screen.blit(score_surf, position)
+        return self._screen.blit(score_surf, position)
 
 
 class StartScreen:
@@ -208,27 +331,45 @@ class StartScreen:
         # Whether we've reinitialised the screen.
         self._init = False
 
-        # The key for the powerups - their images with names and descriptions.
-        self._powerups = ((itertools.cycle(load_png_sequence('powerup_laser')),
-                           'laser',
-                           'enables the vaus\nto fire a laser'),
-                          (itertools.cycle(load_png_sequence('powerup_slow')),
-                           'slow',
-                           'slow down the\nenergy ball'),
-                          (itertools.cycle(load_png_sequence('powerup_life')),
-                           'extra life',
-                           'gain an additional\nvaus'),
-                          (
-                          itertools.cycle(load_png_sequence('powerup_expand')),
-                          'expand',
-                          'expands the vaus'),
-                          (itertools.cycle(load_png_sequence('powerup_catch')),
-                           'catch',
-                           'catches the energy\nball'),
-                          (itertools.cycle(load_png_sequence(
-                              'powerup_duplicate')),
-                           'duplicate',
-                           'duplicates the energy\nball'))
+        # The key for the powerups - their animation frames with names and
+        # descriptions. The text never changes, so it is rendered up front,
+        # as are the positions of each powerup in the key.
+        powerups = (('powerup_laser', 'laser',
+                     'enables the vaus\nto fire a laser'),
+                    ('powerup_slow', 'slow',
+                     'slow down the\nenergy ball'),
+                    ('powerup_life', 'extra life',
+                     'gain an additional\nvaus'),
+                    ('powerup_expand', 'expand',
+                     'expands the vaus'),
+                    ('powerup_catch', 'catch',
+                     'catches the energy\nball'),
+                    ('powerup_duplicate', 'duplicate',
+                     'duplicates the energy\nball'))
+        self._powerups = []
+        # The text that stays the same, and where it goes on the screen.
+        static_text = []
+        left, top = 30, 270
+
+        for filename_prefix, name, desc in powerups:
+            frames = [image for image, _ in load_png_sequence(filename_prefix)]
+            self._powerups.append((frames, (left, top)))
+            static_text += (
+                (ptext.getsurf(name.upper(),
+                               fontname=ALT_FONT,
+                               fontsize=20,
+                               color=(255, 255, 255)),
+                 (left + frames[0].get_width() + 20, top - 3)),
+                (ptext.getsurf(desc.upper(),
+                               fontname=ALT_FONT,
+                               fontsize=14,
+                               color=(255, 255, 255)),
+                 (left, top + 25)))
+            left += 180
+
+            if left > 400:
+                left = 30
+                top += 100
 
         # Whether the event listeners have been registered.
         self._registered = False
@@ -241,9 +382,43 @@ class StartScreen:
                                                (255, 0, 0)])
         self._text_color_2 = None
 
+        # The text on the start screen is fixed, apart from the colour of
+        # the captions, so it is rendered just once for each colour it's
+        # shown in.
+        static_text.append((ptext.getsurf('POWERUPS',
+                                          fontname=ALT_FONT,
+                                          fontsize=32,
+                                          color=(255, 255, 255)),
+                            (210, 200)))
+        self._start_text = {color: ptext.getsurf('SPACEBAR TO START',
+                                                 fontname=ALT_FONT,
+                                                 fontsize=48,
+                                                 color=color,
+                                                 shadow=(1.0, 1.0),
+                                                 scolor='grey')
+                            for color in ((255, 255, 255), (255, 255, 0))}
+        self._level_text = {color: ptext.getsurf('OR ENTER LEVEL',
+                                                 fontname=ALT_FONT,
+                                                 fontsize=32,
+                                                 color=color)
+                            for color in ((255, 255, 0), (255, 0, 0))}
+        static_text.append((ptext.getsurf('Based on original Arkanoid game\n'
+                                          'by Taito Corporation 1986',
+                                          align='center',
+                                          fontname=ALT_FONT,
+                                          fontsize=24,
+                                          color=(128, 128, 128)),
+                            (100, 700)))
+
+        # The text that doesn't change is drawn once, as part of the layer
+        # that clears the screen when the start screen is first shown.
+        self._static_layer = self._create_static_layer(static_text)
+
         # The text entered by the user.
         self._user_input = ''
         self._user_input_pos = None
+        # Used to erase the text entered by the user.
+        self._input_eraser = pygame.Surface((50, 50))
 
         # Keep track of display count for animation purposes.
         self._display_count = 0
@@ -258,67 +433,70 @@ class StartScreen:
             receiver.register_handler(pygame.KEYUP, self._on_keyup)
             self._registered = True
 
+        # The captions are only drawn when the screen is first shown and
+        # when their colour changes.
+        draw_captions = not self._init
+
         if not self._init:
             self._init = True
-            self._screen.blit(pygame.Surface((600, 650)), (0, TOP_OFFSET))
+            self._screen.blit(self._static_layer, (0, TOP_OFFSET))
 
-        ptext.draw('POWERUPS', (210, 200),
-                   fontname=ALT_FONT,
-                   fontsize=32,
-                   color=(255, 255, 255))
-
-        left, top = 30, 270
-
-        for anim, name, desc in self._powerups:
-            if self._display_count % 4 == 0:
-                image, _ = next(anim)
-                self._screen.blit(image, (left, top))
-                ptext.draw(name.upper(), (left + image.get_width() + 20,
-                                          top-3),
-                           fontname=ALT_FONT,
-                           fontsize=20,
-                           color=(255, 255, 255))
-                ptext.draw(desc.upper(), (left, top + 25),
-                           fontname=ALT_FONT,
-                           fontsize=14,
-                           color=(255, 255, 255))
-            left += 180
-
-            if left > 400:
-                left = 30
-                top += 100
+        if self._display_count % 4 == 0:
+            # Step the powerup animations on to their next frame.
+            index = self._display_count // 4
+            self._screen.blits(
+                [(frames[index % len(frames)], pos)
+                 for frames, pos in self._powerups],
+                doreturn=False)
 
         if self._display_count % 15 == 0:
             self._text_color_1 = next(self._text_colors_1)
             self._text_color_2 = next(self._text_colors_2)
+            draw_captions = True
 
-        ptext.draw('SPACEBAR TO START', (50, 500),
-                   fontname=ALT_FONT,
-                   fontsize=48,
-                   color=self._text_color_1,
-                   shadow=(1.0, 1.0),
-                   scolor="grey")
-
-        ptext.draw('OR ENTER LEVEL', (160, 575),
-                   fontname=ALT_FONT,
-                   fontsize=32,
-                   color=self._text_color_2)
+        if draw_captions:
+            self._draw_captions()
 
         self._user_input_pos = ptext.draw(self._user_input, (280, 625),
                                           fontname=ALT_FONT,
                                           fontsize=40,
                                           color=(255, 255, 255))[1]
 
-        ptext.draw('Based on original Arkanoid game\n'
-                   'by Taito Corporation 1986',
-                   (100, 700),
-                   align='center',
-                   fontname=ALT_FONT,
-                   fontsize=24,
-                   color=(128, 128, 128))
-
         self._display_count += 1
 
+    def _draw_captions(self):
+        """Draw the captions in their current colours.
+
+        Each caption is drawn over a patch of the static layer, so that it
+        replaces the caption in the previous colour rather than being
+        blended with it.
+        """
+        blits = []
+        for surf, pos in ((self._start_text[self._text_color_1], (50, 500)),
+                          (self._level_text[self._text_color_2], (160, 575))):
+            rect = surf.get_rect(topleft=pos)
+            blits.append((self._static_layer, rect,
+                          rect.move(0, -TOP_OFFSET)))
+            blits.append((surf, rect))
+        self._screen.blits(blits, doreturn=False)
+
+    def _create_static_layer(self, static_text):
+        """Create the surface that clears the start screen area, with the
+        text that never changes already drawn on it.
+
+        Args:
+            static_text:
+                A list of 2-tuples of the rendered text and its position on
+                the screen.
+        Returns:
+            The layer surface, to be drawn at the top offset.
+        """
+        width, height = self._screen.get_size()
+        layer = pygame.Surface((width, height - TOP_OFFSET)).convert()
+        layer.blits([(surf, (x, y - TOP_OFFSET)) for surf, (x, y)
+                     in static_text], doreturn=False)
+        return layer
+
     def hide(self):
         """Hide the start screen and unregister event listeners."""
         receiver.unregister_handler(self._on_keyup)
@@ -333,19 +511,15 @@ class StartScreen:
                 The pygame event.
 
         """
-        numeric_keys = {pygame.K_0: '0', pygame.K_1: '1', pygame.K_2: '2',
-                        pygame.K_3: '3', pygame.K_4: '4', pygame.K_5: '5',
-                        pygame.K_6: '6', pygame.K_7: '7', pygame.K_8: '8',
-                        pygame.K_9: '9'}
         if event.key == pygame.K_SPACE:
             self._on_start(1)
-        elif event.key in numeric_keys and len(self._user_input) < 2:
-            self._user_input += numeric_keys[event.key]
+        elif event.key in NUMERIC_KEYS and len(self._user_input) < 2:
+            self._user_input += str(event.key - pygame.K_0)
         elif event.key == pygame.K_BACKSPACE:
             self._user_input = ''
-            self._screen.blit(pygame.Surface((50, 50)), self._user_input_pos)
+            self._screen.blit(self._input_eraser, self._user_input_pos)
         elif event.key == pygame.K_RETURN and self._user_input:
-            self._screen.blit(pygame.Surface((50, 50)), self._user_input_pos)
+            self._screen.blit(self._input_eraser, self._user_input_pos)
             self._on_start(int(self._user_input))
             self._user_input = ''
 
@@ -356,6 +530,13 @@ class Game:
     An instance of a Game comes into being when a player starts a new game.
     """
 
+    # Store the game's attributes in slots rather than an instance dict, as
+    # many of them are accessed every frame.
+    __slots__ = ('lives', 'score', 'dirty_rects', 'round', 'paddle', 'balls',
+                 'sprites', 'static_sprites', 'enemies', 'active_powerup',
+                 'paddle_control', 'over', 'state', '_screen', '_life_img',
+                 '_life_rects', '_lives_drawn', '_life_top', '_life_step')
+
     def __init__(self, round_class=Round1, lives=3):
         """Initialise a new Game.
 
@@ -372,10 +553,22 @@ class Game:
         # Reference to the main screen.
         self._screen = pygame.display.get_surface()
 
+        # The areas of the screen that have been drawn on since the display
+        # was last updated. The whole screen is drawn when a round is
+        # created.
+        self.dirty_rects = [self._screen.get_rect()]
+
         # The life graphic.
         self._life_img, _ = load_png('paddle_life.png')
         # The life graphic positions.
         self._life_rects = []
+        # The number of lives that the life graphics currently show.
+        self._lives_drawn = None
+        # The vertical position of the life graphics, and the horizontal
+        # distance between each one. These don't change during a game.
+        self._life_top = (self._screen.get_height() -
+                          self._life_img.get_height() - 5)
+        self._life_step = self._life_img.get_width() + 5
 
         # The current round.
         self.round = round_class(TOP_OFFSET)
@@ -405,8 +598,13 @@ class Game:
         # Hold a reference to all the sprites for redrawing purposes.
         self.sprites = []
 
-        # Create event handlers required by the game.
-        self._create_event_handlers()
+        # The sprites that never move (the edges and bricks), mapped to the
+        # image and visibility they were last drawn with. These are only
+        # redrawn when they change, or when something is drawn over them.
+        self.static_sprites = {}
+
+        # Whether the player can move the paddle with the arrow keys.
+        self.paddle_control = False
 
         # Whether the game is finished.
         self.over = False
@@ -415,45 +613,131 @@ class Game:
         # current stage of the game.
         self.state = GameStartState(self)
 
-    def update(self):
-        """Update the state of the running game."""
+    def update(self, steps=1):
+        """Update the state of the running game.
+
+        Args:
+            steps:
+                The number of steps of game logic to run before the sprites
+                are redrawn, default 1. Running more than one step lets the
+                game catch up when frames have been dropped.
+        """
+        self._update_state()
+        self._erase_sprites()
+
+        for step in range(steps):
+            if step:
+                self._update_state()
+
+            for sprite in self.sprites:
+                sprite.update()
+
+        # Re-render the sprites.
+        self._draw_sprites()
+        self._update_lives()
+
+    def _update_state(self):
+        """Move the paddle and update the active state."""
+        if self.paddle_control:
+            self._move_paddle()
+
         # Delegate to the active state. This determines the behaviour
         # for the current stage of the game.
         self.state.update()
 
-        # Re-render the sprites.
-        self._update_sprites()
-        self._update_lives()
+    def _erase_sprites(self):
+        """Erase the sprites that move, ready for them to be updated.
 
-    def _update_sprites(self):
-        """Erase the sprites, update their state, and then redraw them
-        on the screen.
+        The static sprites are only erased when they need redrawing, which
+        isn't known until the other sprites have been updated.
         """
-        # Erase.
-        for sprite in self.sprites:
-            self._screen.blit(self.round.background, sprite.rect, sprite.rect)
-
-        # Update and redraw, if visible.
-        for sprite in self.sprites:
-            sprite.update()
-            if sprite.visible:
-                self._screen.blit(sprite.image, sprite.rect)
+        sprites, static_sprites = self.sprites, self.static_sprites
+        background = self.round.background
+
+        # Each sprite's rect is read once, as with pygame-ce it is a property
+        # rather than a plain attribute.
+        rects = [sprite.rect for sprite in sprites
+                 if sprite not in static_sprites]
+        self.dirty_rects += self._screen.blits(
+            [(background, rect, rect) for rect in rects])
+
+    def _draw_sprites(self):
+        """Redraw the sprites on the screen, once they have been updated.
+
+        The sprites that move are redrawn every frame. The static sprites
+        are only erased and redrawn when they have changed, or when
+        something else has been drawn over them this frame.
+        """
+        sprites, screen = self.sprites, self._screen
+        background, dirty_rects = self.round.background, self.dirty_rects
+        static_sprites = self.static_sprites
+
+        # Work out which static sprites need redrawing, and erase them.
+        statics = [sprite for sprite in sprites if sprite in static_sprites]
+        static_rects = [sprite.rect for sprite in statics]
+        drawn_over = dirty_rects + [sprite.rect for sprite in sprites
+                                    if sprite not in static_sprites]
+        redraw = {sprite for sprite in statics
+                  if (sprite.image, sprite.visible) != static_sprites[sprite]
+                  or sprite.rect.collidelist(drawn_over) != -1}
+
+        # Erasing a static sprite also erases the parts of any static sprites
+        # that it overlaps (e.g. the bricks next to the side edges), so those
+        # need redrawing too.
+        pending = list(redraw)
+        while pending:
+            for index in pending.pop().rect.collidelistall(static_rects):
+                sprite = statics[index]
+                if sprite not in redraw:
+                    redraw.add(sprite)
+                    pending.append(sprite)
+
+        for sprite in redraw:
+            static_sprites[sprite] = sprite.image, sprite.visible
+
+        rects = [sprite.rect for sprite in redraw]
+        dirty_rects += screen.blits(
+            [(background, rect, rect) for rect in rects])
+
+        # Redraw, if visible. The sprites are drawn in their original order,
+        # so that they overlap each other in the same way every frame.
+        dirty_rects += screen.blits(
+            [(sprite.image, sprite.rect) for sprite in sprites
+             if sprite.visible and (sprite in redraw or
+                                    sprite not in static_sprites)])
 
     def _update_lives(self):
-        """Update the number of remaining lives displayed on the screen."""
+        """Update the number of remaining lives displayed on the screen.
+
+        The life graphics are only redrawn when the number of lives has
+        changed, or when something else has been drawn over them this frame
+        (e.g. a falling powerup, or the screen for a new round).
+        """
+        screen, life_rects = self._screen, self._life_rects
+        dirty_rects = self.dirty_rects
+
+        if self.lives == self._lives_drawn and not any(
+                rect.collidelist(dirty_rects) != -1 for rect in life_rects):
+            return
+
+        background = self.round.background
+
         # Erase the existing lives.
-        for rect in self._life_rects:
-            self._screen.blit(self.round.background, rect, rect)
-        self._life_rects.clear()
+        screen.blits([(background, rect, rect) for rect in life_rects],
+                     doreturn=False)
+        dirty_rects += life_rects
+        life_rects.clear()
 
         # Display the remaining lives.
-        left = self.round.edges.left.rect.width
-        top = self._screen.get_height() - self._life_img.get_height() - 5
+        left, top = self.round.edges.left.rect.width, self._life_top
+        step, img = self._life_step, self._life_img
+
+        life_rects += screen.blits(
+            [(img, (left + life * step, top))
+             for life in range(self.lives - 1)])
 
-        for life in range(self.lives - 1):
-            self._life_rects.append(
-                self._screen.blit(self._life_img, (left, top)))
-            left += self._life_img.get_width() + 5
+        dirty_rects += life_rects
+        self._lives_drawn = self.lives
 
     def on_brick_collide(self, brick, sprite):
         """Called by a sprite when it collides with a brick.
@@ -484,6 +768,11 @@ class Game:
             # whether the round is completed.
             self.round.brick_destroyed()
 
+            # The balls can no longer collide with the brick, so they no
+            # longer need to consider it.
+            for ball in self.balls:
+                ball.remove_collidable_sprite(brick)
+
         if brick.powerup_cls:
             # There is a powerup in the brick.
             # Figure out whether we should release it.
@@ -597,32 +886,22 @@ class Game:
             if not isinstance(self.state, BallOffScreenState):
                 self.state = BallOffScreenState(self)
 
-    def _create_event_handlers(self):
-        """Create the event handlers for paddle movement."""
-        keys_down = 0
-
-        def move_left(event):
-            nonlocal keys_down
-            if event.key == pygame.K_LEFT:
-                self.paddle.move_left()
-                keys_down += 1
-        self.handler_move_left = move_left
-
-        def move_right(event):
-            nonlocal keys_down
-            if event.key == pygame.K_RIGHT:
-                self.paddle.move_right()
-                keys_down += 1
-        self.handler_move_right = move_right
-
-        def stop(event):
-            nonlocal keys_down
-            if event.key == pygame.K_LEFT or event.key == pygame.K_RIGHT:
-                if keys_down > 0:
-                    keys_down -= 1
-                if keys_down == 0:
-                    self.paddle.stop()
-        self.handler_stop = stop
+    def _move_paddle(self):
+        """Move the paddle according to the arrow keys currently held down.
+
+        The keyboard state is polled once per frame, rather than tracking
+        the paddle movement through individual KEYDOWN/KEYUP events. When
+        both arrow keys are held down, they cancel each other out.
+        """
+        keys = pygame.key.get_pressed()
+        direction = keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]
+
+        if direction < 0:
+            self.paddle.move_left()
+        elif direction > 0:
+            self.paddle.move_right()
+        else:
+            self.paddle.stop()
 
     @property
     def ball(self):
@@ -651,6 +930,9 @@ class Game:
 class BaseState:
     """Abstract base class holding behaviour common to all states."""
 
+    # Subclasses declare slots for any attributes they add.
+    __slots__ = ('game',)
+
     def __init__(self, game):
         self.game = game
 
@@ -675,6 +957,8 @@ class GameStartState(BaseState):
     sequence.
     """
 
+    __slots__ = ()
+
     def __init__(self, game):
         super().__init__(game)
 
@@ -682,11 +966,8 @@ class GameStartState(BaseState):
         self.game.paddle.visible = False
         self.game.ball.visible = False
 
-        # Register the event handlers for paddle control.
-        receiver.register_handler(pygame.KEYDOWN,
-                                  self.game.handler_move_left,
-                                  self.game.handler_move_right)
-        receiver.register_handler(pygame.KEYUP, self.game.handler_stop)
+        # Hand control of the paddle to the player.
+        self.game.paddle_control = True
 
     def update(self):
         # TODO: implement the game intro sequence (animation).
@@ -701,6 +982,9 @@ class RoundStartState(BaseState):
     round to begin.
     """
 
+    __slots__ = ('_screen', '_paddle_reset', '_update_count', '_caption_surf',
+                 '_ready_surf', '_caption', '_ready')
+
     def __init__(self, game):
         super().__init__(game)
 
@@ -726,6 +1010,14 @@ class RoundStartState(BaseState):
         # Keep track of the number of update cycles.
         self._update_count = 0
 
+        # The caption and "Ready" text are rendered once up front, and then
+        # just blitted on each update.
+        self._caption_surf = self._render_text(self.game.round.name)
+        self._ready_surf = self._render_text('ready')
+
+        # The caption and "Ready" text, and where they were drawn.
+        self._caption, self._ready = None, None
+
     def _setup_sprites(self):
         """Make all the sprites available for rendering."""
         self.game.sprites.clear()
@@ -734,15 +1026,21 @@ class RoundStartState(BaseState):
         self.game.sprites += self.game.round.edges
         self.game.sprites += self.game.round.bricks
 
+        # The edges and bricks don't move, so are only redrawn when needed.
+        # None means that they have yet to be drawn.
+        self.game.static_sprites = dict.fromkeys(
+            itertools.chain(self.game.round.edges, self.game.round.bricks))
+
     def _configure_ball(self):
         self.game.ball.remove_all_collidable_sprites()
 
         for edge in self.game.round.edges:
             # Every collision with a wall momentarily increases the speed
-            # of the ball.
+            # of the ball. The edges never move, so they are static.
             self.game.ball.add_collidable_sprite(
                 edge,
-                speed_adjust=WALL_SPEED_ADJUST)
+                speed_adjust=WALL_SPEED_ADJUST,
+                static=True)
 
         self.game.ball.add_collidable_sprite(
             self.game.paddle,
@@ -756,7 +1054,8 @@ class RoundStartState(BaseState):
             self.game.ball.add_collidable_sprite(
                 brick,
                 speed_adjust=BRICK_SPEED_ADJUST,
-                on_collide=self.game.on_brick_collide)
+                on_collide=self.game.on_brick_collide,
+                static=True)
 
         # Make any round-specific adjustments to the ball.
         self.game.ball.base_speed += self.game.round.ball_base_speed_adjust
@@ -771,53 +1070,81 @@ class RoundStartState(BaseState):
         """Handle the sequence of events that happen at the beginning of a
         round just before gameplay starts.
         """
-        caption, ready = None, None
+        count = self._update_count
+        game = self.game
+        paddle, ball = game.paddle, game.ball
 
-        if self._update_count > 100:
+        if 100 < count <= 310:
             # Display the caption after a short delay.
-            caption = ptext.draw(self.game.round.name,
-                                 (235, self.game.paddle.rect.center[1] - 150),
-                                 fontname=MAIN_FONT,
-                                 fontsize=24,
-                                 color=(255, 255, 255))
-        if self._update_count > 200:
-            # Display the "Ready" message.
-            ready = ptext.draw('ready',
-                               (250, caption[1][1] + 50),
-                               fontname=MAIN_FONT,
-                               fontsize=24,
-                               color=(255, 255, 255))
+            self._caption = self._draw_text(
+                self._caption_surf, (235, paddle.rect.center[1] - 150))
+            if count > 200:
+                # Display the "Ready" message.
+                self._ready = self._draw_text(
+                    self._ready_surf, (250, self._caption[1].top + 50))
+        if count > 200:
             # Anchor the ball to the paddle.
-            self.game.ball.anchor(self.game.paddle,
-                                  (self.game.paddle.rect.width // 2,
-                                   -self.game.ball.rect.height))
+            ball.anchor(paddle, (paddle.rect.width // 2, -ball.rect.height))
             # Display the sprites.
             if not self._paddle_reset:
-                self.game.paddle.reset()
+                paddle.reset()
                 self._paddle_reset = True
-            self.game.paddle.visible = True
-            self.game.ball.visible = True
-        if self._update_count == 201:
+            paddle.visible = True
+            ball.visible = True
+        if count == 201:
             # Animate the paddle materializing onto the screen.
-            self.game.paddle.transition(MaterializeState(self.game.paddle))
+            paddle.transition(MaterializeState(paddle))
             # Animate the bricks
-            for brick in self.game.round.bricks:
+            for brick in game.round.bricks:
                 brick.animate()
-        if self._update_count > 310:
-            # Erase the text.
-            self._screen.blit(self.game.round.background, caption[1])
-            self._screen.blit(self.game.round.background, ready[1])
-        if self._update_count > 340:
+        if count == 311:
+            # Erase the text. It is no longer drawn, so this only needs
+            # doing once.
+            background = game.round.background
+            for _, rect in self._caption, self._ready:
+                game.dirty_rects.append(
+                    self._screen.blit(background, rect, rect))
+        if count > 340:
             # Release the anchor.
-            self.game.ball.release(BALL_START_ANGLE_RAD)
+            ball.release(BALL_START_ANGLE_RAD)
             # Normal gameplay begins.
-            self.game.state = RoundPlayState(self.game)
+            game.state = RoundPlayState(game)
 
         self._update_count += 1
 
         # Don't let the paddle move when it's not displayed.
-        if not self.game.paddle.visible:
-            self.game.paddle.stop()
+        if not paddle.visible:
+            paddle.stop()
+
+    @staticmethod
+    def _render_text(text):
+        """Render text to a surface, ready for drawing on the screen.
+
+        Args:
+            text:
+                The text to render.
+        Returns:
+            The surface containing the rendered text.
+        """
+        return ptext.getsurf(text,
+                             fontname=MAIN_FONT,
+                             fontsize=24,
+                             color=(255, 255, 255))
+
+    def _draw_text(self, surf, pos):
+        """Draw rendered text on the screen at the given position.
+
+        Args:
+            surf:
+                The surface containing the rendered text.
+            pos:
+                The topleft position of the text.
+        Returns:
+            A 2-tuple of the text surface and the Rect it was drawn to.
+        """
+        rect = self._screen.blit(surf, pos)
+        self.game.dirty_rects.append(rect)
+        return surf, rect
 
 
 class RoundPlayState(BaseState):
@@ -825,6 +1152,8 @@ class RoundPlayState(BaseState):
     controlling the paddle and ball.
     """
 
+    __slots__ = ()
+
     def __init__(self, game):
         super().__init__(game)
 
@@ -838,6 +1167,8 @@ class BallOffScreenState(BaseState):
     ball going offscreen.
     """
 
+    __slots__ = ('_explode_complete',)
+
     def __init__(self, game):
         super().__init__(game)
 
@@ -868,6 +1199,8 @@ class RoundRestartState(RoundStartState):
     round is restarted due to the ball going off screen.
     """
 
+    __slots__ = ('_lives', '_enemies_rereleased')
+
     def __init__(self, game):
         super().__init__(game)
 
@@ -901,14 +1234,16 @@ class RoundRestartState(RoundStartState):
         # Run the logic in the RoundStartState first.
         super().update()
 
-        if self._update_count > 100:
+        count, game = self._update_count, self.game
+
+        if count > 100:
             # Update the number of lives when we display the caption.
-            self.game.lives = self._lives
-        if self._update_count > 340:
+            game.lives = self._lives
+        if count > 340:
             # Re-release any enemies that were previously active.
             if not self._enemies_rereleased:
-                for enemy in self.game.enemies:
-                    self.game.release_enemy(enemy)
+                for enemy in game.enemies:
+                    game.release_enemy(enemy)
                 self._enemies_rereleased = True
 
 
@@ -916,6 +1251,9 @@ class RoundEndState(BaseState):
     """This state handles the behaviour when the round ends (is completed
     successfully).
     """
+
+    __slots__ = ('_update_count',)
+
     def __init__(self, game):
         super().__init__(game)
 
@@ -944,6 +1282,9 @@ class RoundEndState(BaseState):
             self.game.balls = self.game.balls[:1]
             if self.game.round.next_round is not None:
                 self.game.round = self.game.round.next_round(TOP_OFFSET)
+                # The new round has drawn over the whole screen.
+                self.game.dirty_rects.append(
+                    self.game.round.screen.get_rect())
                 self.game.state = RoundStartState(self.game)
             else:
                 # TODO: special behaviour when user completes whole game.
@@ -957,6 +1298,8 @@ class GameEndState(BaseState):
     lives being lost, or when the player successfully reaches the very end.
     """
 
+    __slots__ = ()
+
     def __init__(self, game):
         super().__init__(game)
 
@@ -968,10 +1311,8 @@ class GameEndState(BaseState):
         # Indicate that the game is over.
         game.over = True
 
-        # Unregister the event handlers.
-        receiver.unregister_handler(self.game.handler_move_left,
-                                    self.game.handler_move_right,
-                                    self.game.handler_stop)
+        # Take control of the paddle away from the player.
+        game.paddle_control = False
 
     def update(self):
         pass
@@ -11,6 +11,9 @@ BLUE = (0, 0, 128)
 GREEN = (0, 128, 0)
 RED = (128, 0, 0)
 
+# Holds the edge sprites of a round.
+Edges = collections.namedtuple('Edges', 'left right top')
+
 
 class BaseRound:
     """Abstract base class for all Arkanoid rounds.
@@ -47,6 +50,10 @@ class BaseRound:
         # them on the screen.
         self.bricks = self._create_bricks()
 
+        # The positioned bricks are blitted to the screen in a single call.
+        self.screen.blits([(brick.image, brick.rect) for brick in
+                           self.bricks], doreturn=False)
+
         # Concrete subclasses can override this setting to modify the
         # base speed of the ball for the round, if they want the ball to move
         # more quickly/slowly for that particular round.
@@ -100,8 +107,8 @@ class BaseRound:
         raise NotImplementedError('Subclasses must implement '
                                   'can_release_enemies()')
 
-    def _blit_brick(self, brick, x, y):
-        """Blits the specified brick onto the game area by using a
+    def _position_brick(self, brick, x, y):
+        """Positions the specified brick on the game area by using a
         relative coordinate for the position of the brick.
 
         This is a convenience method that concrete subclasses can use when
@@ -111,7 +118,8 @@ class BaseRound:
         allows clients to avoid having to work with actual screen positions.
 
         Note that this method will modify the brick's rect attribute once
-        the brick has been set.
+        the brick has been set. The brick itself is blitted to the screen,
+        along with all the other bricks, once _create_bricks() returns.
 
         Args:
             brick:
@@ -121,16 +129,15 @@ class BaseRound:
             y:
                 The y position on the grid.
         Returns:
-            The blitted brick.
+            The positioned brick.
         """
         offset_x = brick.rect.width * x
         offset_y = brick.rect.height * y
 
-        rect = self.screen.blit(brick.image, (self.edges.left.rect.x +
-                                self.edges.left.rect.width + offset_x,
-                                self.edges.top.rect.y +
-                                self.edges.top.rect.height + offset_y))
-        brick.rect = rect
+        brick.rect.topleft = (self.edges.left.rect.x +
+                              self.edges.left.rect.width + offset_x,
+                              self.edges.top.rect.y +
+                              self.edges.top.rect.height + offset_y)
         return brick
 
     def _create_background(self):
@@ -173,14 +180,13 @@ class BaseRound:
             A named tuple with attributes 'left', 'right', and 'top' that
             reference the corresponding edge sprites.
         """
-        edges = collections.namedtuple('edge', 'left right top')
         left_edge = SideEdge('left')
         right_edge = SideEdge('right')
         top_edge = TopEdge()
         left_edge.rect.topleft = 0, self.top_offset
         right_edge.rect.topright = self.screen.get_width(), self.top_offset
         top_edge.rect.topleft = left_edge.rect.width, self.top_offset
-        return edges(left_edge, right_edge, top_edge)
+        return Edges(left_edge, right_edge, top_edge)
 
     def _create_bricks(self):
         """Create the bricks and position them on the screen.
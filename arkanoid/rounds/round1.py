@@ -93,4 +93,4 @@ class Round1(BaseRound):
                 y += 1
             else:
                 x += 1
-            self._blit_brick(brick, x, y)
+            self._position_brick(brick, x, y)
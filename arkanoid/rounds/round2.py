@@ -78,7 +78,7 @@ class Round2(BaseRound):
             else:
                 brick = Brick(BrickColour.red, 2, powerup_cls=SlowBallPowerUp)
 
-            bricks.append(self._blit_brick(brick, x, y))
+            bricks.append(self._position_brick(brick, x, y))
 
             colour = next(colours)
             for _ in range(i):
@@ -86,7 +86,7 @@ class Round2(BaseRound):
                 powerup = remaining_powerup_indexes.get(count)
                 y -= 1
                 brick = Brick(colour, 2, powerup_cls=powerup)
-                bricks.append(self._blit_brick(brick, x, y))
+                bricks.append(self._position_brick(brick, x, y))
                 count += 1
 
             x += 1
@@ -103,7 +103,7 @@ class Round3(BaseRound):
             except TypeError:
                 colour, powerup = row, None
             brick = Brick(colour, 3, powerup_cls=powerup)
-            bricks.append(self._blit_brick(brick, x, y))
+            bricks.append(self._position_brick(brick, x, y))
             x += 1
 
         return pygame.sprite.Group(*bricks)
@@ -76,8 +76,8 @@ class Round4(BaseRound):
                         brick = Brick(colour, 4,
                                       powerup_cls=powerups.get((x, y)))
                         bricks.append(
-                            self._blit_brick(brick, x,
-                                             y + self._TOP_ROW_START))
+                            self._position_brick(brick, x,
+                                                 y + self._TOP_ROW_START))
             column.rotate(-1)
 
         return pygame.sprite.Group(*bricks)
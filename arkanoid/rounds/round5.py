@@ -44,20 +44,21 @@ class Round5(BaseRound):
         Returns:
             A pygame.sprite.Group of bricks.
         """
-        bricks = [self._blit_brick(Brick(BrickColour.orange, 5,
-                                         powerup_cls=ExpandPowerUp), 4, 2),
-                  self._blit_brick(Brick(BrickColour.orange, 5,
-                                         powerup_cls=LaserPowerUp), 8, 2),
-                  self._blit_brick(Brick(BrickColour.orange, 5), 5, 3),
-                  self._blit_brick(Brick(BrickColour.orange, 5,
-                                         powerup_cls=SlowBallPowerUp), 7, 3),
-                  self._blit_brick(Brick(BrickColour.orange, 5), 5, 4),
-                  self._blit_brick(Brick(BrickColour.orange, 5), 7, 4)]
+        bricks = [self._position_brick(Brick(BrickColour.orange, 5,
+                                             powerup_cls=ExpandPowerUp), 4, 2),
+                  self._position_brick(Brick(BrickColour.orange, 5,
+                                             powerup_cls=LaserPowerUp), 8, 2),
+                  self._position_brick(Brick(BrickColour.orange, 5), 5, 3),
+                  self._position_brick(Brick(BrickColour.orange, 5,
+                                             powerup_cls=SlowBallPowerUp),
+                                       7, 3),
+                  self._position_brick(Brick(BrickColour.orange, 5), 5, 4),
+                  self._position_brick(Brick(BrickColour.orange, 5), 7, 4)]
 
         for y in range(5, 7):
             for x in range(4, 9):
-                bricks.append(self._blit_brick(Brick(BrickColour.silver, 5),
-                                               x, y))
+                bricks.append(self._position_brick(
+                    Brick(BrickColour.silver, 5), x, y))
 
         for y in range(7, 9):
             for x in range(3, 10):
@@ -69,7 +70,7 @@ class Round5(BaseRound):
                         powerup_cls = CatchPowerUp
                     elif (x, y) == (7, 8):
                         powerup_cls = DuplicatePowerUp
-                bricks.append(self._blit_brick(
+                bricks.append(self._position_brick(
                     Brick(colour, 5, powerup_cls=powerup_cls), x, y))
 
         for y in range(9, 16):
@@ -84,7 +85,7 @@ class Round5(BaseRound):
                     powerup_cls = None
                     if (x, y) == (7, 14):
                         powerup_cls = LaserPowerUp
-                    bricks.append(self._blit_brick(
+                    bricks.append(self._position_brick(
                         Brick(BrickColour.silver, 5,
                               powerup_cls=powerup_cls), x, y))
 
@@ -4,10 +4,12 @@ import random
 
 import pygame
 
+from arkanoid.utils.spatial import SpatialHash
 from arkanoid.utils.util import load_png
 
 LOG = logging.getLogger(__name__)
 
+PI = math.pi
 TWO_PI = math.pi * 2
 HALF_PI = math.pi / 2
 
@@ -15,6 +17,10 @@ HALF_PI = math.pi / 2
 # to apply to the angle of bounce for top/bottom/side collisions of the ball.
 RANDOM_RANGE = 0.1  # Radians
 
+# The number of corners of the ball in contact, indexed by the 4-bit
+# corner mask built when detecting the collide points.
+CORNER_COUNTS = tuple(bin(mask).count('1') for mask in range(16))
+
 
 class Ball(pygame.sprite.Sprite):
     """The ball that bounces around the screen.
@@ -88,17 +94,42 @@ class Ball(pygame.sprite.Sprite):
         screen = pygame.display.get_surface()
         self._area = screen.get_rect()
 
-        # The sprites the ball can collide with.
-        self._collidable_sprites = pygame.sprite.Group()
-
-        # The actions associated with the collidable sprites.
-        # This dictionary is keyed by the collidable sprite. The value is
-        # a 3-element tuple corresponding to the bounce strategy, speed
-        # adjustment and collision callback for that sprite.
+        # The sprites the ball can collide with, and the actions associated
+        # with them. This dictionary is keyed by the collidable sprite. The
+        # value is a 3-element tuple corresponding to the bounce strategy,
+        # speed adjustment and collision callback for that sprite.
         self._collision_data = {}
 
+        # Collidable sprites that don't move (e.g. bricks) are bucketed in a
+        # grid, so that only those near the ball need to be tested.
+        self._static_sprites = SpatialHash()
+
+        # A flat list of the remaining (moving) collidable sprites, which are
+        # always tested. It is rebuilt lazily whenever a collidable sprite is
+        # added or removed, rather than on every update.
+        self._dynamic_sprites = None
+
+        # The position of each collidable sprite in the order the sprites
+        # were added. Used to keep the order of collision handling stable.
+        self._sprite_order = None
+
+    @property
+    def angle(self):
+        """The angle of travel of the ball in radians, measured clockwise
+        from the righthand x-axis.
+        """
+        return self._angle
+
+    @angle.setter
+    def angle(self, angle):
+        self._angle = angle
+        # The direction of travel only changes when the angle does, so it
+        # is calculated here rather than every time the ball moves.
+        self._direction = math.cos(angle), math.sin(angle)
+
     def add_collidable_sprite(self, sprite, bounce_strategy=None,
-                              speed_adjust=0.0, on_collide=None):
+                              speed_adjust=0.0, on_collide=None,
+                              static=False):
         """Add a sprite that the ball might collide with.
 
         A bounce strategy can be supplied to override the default bouncing
@@ -115,6 +146,10 @@ class Ball(pygame.sprite.Sprite):
         The callable takes two arguments: the sprite that the ball struck and
         the ball that struck it.
 
+        Sprites that will never move whilst the ball knows about them (such
+        as bricks) should be added with static=True, which allows the ball
+        to skip testing them when they're not nearby.
+
         Args:
             sprite:
                 The collidable sprite.
@@ -129,10 +164,16 @@ class Ball(pygame.sprite.Sprite):
                 Optional callable that will be called when a collision occurs.
                 It takes 2 arguments: the sprite the ball struck and the ball
                 that struck it.
+            static:
+                Optional flag indicating that the sprite will not move
+                (default False).
         """
-        self._collidable_sprites.add(sprite)
+        self._static_sprites.remove(sprite)
+        if static:
+            self._static_sprites.insert(sprite)
         self._collision_data[sprite] = (
             bounce_strategy, speed_adjust, on_collide)
+        self._dynamic_sprites = None
 
     def remove_collidable_sprite(self, sprite):
         """Remove a sprite so that the ball can no longer collide with it.
@@ -144,16 +185,23 @@ class Ball(pygame.sprite.Sprite):
             sprite:
                 The collidable sprite to remove.
         """
-        self._collidable_sprites.remove(sprite)
         try:
             del self._collision_data[sprite]
         except KeyError:
             pass
+        else:
+            if sprite in self._static_sprites:
+                # Only the grid holds static sprites, so the flat list of
+                # dynamic sprites doesn't need rebuilding.
+                self._static_sprites.remove(sprite)
+            else:
+                self._dynamic_sprites = None
 
     def remove_all_collidable_sprites(self):
         """Remove all collidable sprites from the ball."""
-        self._collidable_sprites.empty()
         self._collision_data.clear()
+        self._static_sprites.clear()
+        self._dynamic_sprites = None
 
     def clone(self, **kwargs):
         """Clone the ball creating a new ball with the same collidable
@@ -183,11 +231,11 @@ class Ball(pygame.sprite.Sprite):
         ball = Ball(start_pos, start_angle, base_speed, top_speed,
                     normalisation_rate, off_screen_callback)
 
-        for sprite in self._collidable_sprites:
-            bounce_strategy, speed_adjust, on_collide = self._collision_data[
-                sprite]
+        for sprite, (bounce_strategy, speed_adjust,
+                     on_collide) in self._collision_data.items():
             ball.add_collidable_sprite(sprite, bounce_strategy, speed_adjust,
-                                       on_collide)
+                                       on_collide,
+                                       static=sprite in self._static_sprites)
 
         return ball
 
@@ -204,9 +252,7 @@ class Ball(pygame.sprite.Sprite):
             if not self._anchor:
                 # The ball is still on the screen and is not anchored, so see
                 # if it has collided with anything.
-                sprites_collided = pygame.sprite.spritecollide(
-                    self,
-                    (s for s in self._collidable_sprites if s.visible), False)
+                sprites_collided = self._detect_collisions()
 
                 if sprites_collided:
                     # Handle the collision.
@@ -220,42 +266,75 @@ class Ball(pygame.sprite.Sprite):
             if self._off_screen_callback:
                 self._off_screen_callback(self)
 
+    def _detect_collisions(self):
+        """Detect the collidable sprites that the ball has collided with.
+
+        Only the static sprites in the vicinity of the ball are tested,
+        together with all the dynamic sprites, in a single call into pygame.
+        Just the sprites that were struck have their visibility checked -
+        which for some sprites (e.g. bricks) is a computed property.
+
+        Returns:
+            A list of the visible sprites that the ball collided with, in
+            the order they were added to the ball.
+        """
+        if self._dynamic_sprites is None:
+            self._dynamic_sprites = [sprite for sprite in self._collision_data
+                                     if sprite not in self._static_sprites]
+            self._sprite_order = {sprite: i for i, sprite in
+                                  enumerate(self._collision_data)}
+
+        rect = self.rect
+        candidates = self._dynamic_sprites + self._static_sprites.query(rect)
+
+        sprites_collided = [sprite for sprite in
+                            rect.collideobjectsall(candidates)
+                            if sprite.visible]
+
+        if len(sprites_collided) > 1:
+            sprites_collided.sort(key=self._sprite_order.__getitem__)
+
+        return sprites_collided
+
     def _calc_new_pos(self):
+        # The rect is repositioned in place in all cases, to avoid
+        # allocating a new one every frame.
         if self._anchor:
             pos, rel_pos = self._anchor
             try:
                 rect = pos.rect
             except AttributeError:
                 # A fixed position.
-                return pygame.Rect(pos, (self.rect.width, self.rect.height))
+                self.rect.topleft = pos
+                return self.rect
             # We're anchored to another sprite.
             if rel_pos:
                 # Use the relative position from the sprite's left/top.
-                return pygame.Rect(rect.left + rel_pos[0],
-                                   rect.top + rel_pos[1], self.rect.width,
-                                   self.rect.height)
-            # Use the centre of the sprite.
-            return rect.center
+                self.rect.topleft = (rect.left + rel_pos[0],
+                                     rect.top + rel_pos[1])
+            else:
+                # Use the centre of the sprite.
+                self.rect.center = rect.center
         else:
             # Move the ball normally based on angle and speed.
-            offset_x = self.speed * math.cos(self.angle)
-            offset_y = self.speed * math.sin(self.angle)
+            dx, dy = self._direction
+            self.rect.move_ip(self.speed * dx, self.speed * dy)
 
-            return self.rect.move(offset_x, offset_y)
+        return self.rect
 
     def _handle_collision(self, sprites):
         rects, bounce_strategy = [], None
 
         for sprite in sprites:
+            strategy, speed_adjust, on_collide = self._collision_data[sprite]
             rects.append(sprite.rect)
             if not bounce_strategy:
-                bounce_strategy = self._collision_data[sprite][0]
+                bounce_strategy = strategy
 
             if self.speed < self._top_speed:
                 # Adjust the speed based on what we collided with.
-                self.speed += self._collision_data[sprite][1]
+                self.speed += speed_adjust
 
-            on_collide = self._collision_data[sprite][2]
             if on_collide:
                 # Invoke a collision action if we have one.
                 on_collide(sprite, self)
@@ -288,30 +367,33 @@ class Ball(pygame.sprite.Sprite):
         """
         tl, tr, bl, br = self._determine_collide_points(rects)
 
-        angle = self.angle
+        # The current angle is read once into a local, as it is referenced
+        # repeatedly below.
+        angle = current = self.angle
+        corners = tl + tr + bl + br
 
-        if [tl, tr, bl, br].count(True) in (1, 3, 4):
+        if corners in (1, 3, 4):
             # Ball has collided with a corner, or is fully inside another
             # sprite. Bounce it back in the direction it came from. Note we
             # don't apply any randomness here, as we need the ball to go back
             # in exactly the opposite direction to prevent it from getting
             # stuck if it is inside a sprite.
             LOG.debug('Corner or multipoint collision')
-            if self.angle > math.pi:
-                angle = self.angle - math.pi
+            if current > PI:
+                angle = current - PI
             else:
-                angle = self.angle + math.pi
-            if [tl, tr, bl, br].count(True) == 1:
+                angle = current + PI
+            if corners == 1:
                 # Add some randomness to corner collisions to prevent bounce
                 # loops.
                 angle += random.uniform(-RANDOM_RANGE, RANDOM_RANGE)
         else:
-            top_collision = tl and tr and self.angle > math.pi
-            bottom_collision = bl and br and self.angle < math.pi
+            top_collision = tl and tr and current > PI
+            bottom_collision = bl and br and current < PI
 
             if top_collision or bottom_collision:
                 LOG.debug('Top/bottom collision')
-                angle = TWO_PI - self.angle
+                angle = TWO_PI - current
                 # Prevent vertical bounce loops by detecting near vertical
                 # angles and adjusting the angle of bounce.
                 if (TWO_PI - HALF_PI - 0.06) < angle < (
@@ -322,20 +404,20 @@ class Ball(pygame.sprite.Sprite):
 
             else:
                 left_collision = (tl and bl and
-                                  HALF_PI < self.angle < TWO_PI - HALF_PI)
+                                  HALF_PI < current < TWO_PI - HALF_PI)
                 right_collision = tr and br and (
-                    self.angle > TWO_PI - HALF_PI or self.angle < HALF_PI)
+                    current > TWO_PI - HALF_PI or current < HALF_PI)
 
                 if left_collision or right_collision:
                     LOG.debug('Side collision')
-                    if self.angle < math.pi:
-                        angle = math.pi - self.angle
+                    if current < PI:
+                        angle = PI - current
                     else:
-                        angle = (TWO_PI - self.angle) + math.pi
+                        angle = (TWO_PI - current) + PI
 
                     # Prevent horizontal bounce loops by detecting near
                     # horizontal angles and adjusting the angle of bounce.
-                    if math.pi - 0.06 < angle < math.pi + 0.06:
+                    if PI - 0.06 < angle < PI + 0.06:
                         angle += 0.35
                     elif angle > TWO_PI - 0.06:
                         angle -= 0.35
@@ -364,40 +446,51 @@ class Ball(pygame.sprite.Sprite):
             bottom left and bottom right corners of the ball. True for any
             of these indicates collision.
         """
-        tl, tr, bl, br = False, False, False, False
+        left, top, right, bottom = (self.rect.left, self.rect.top,
+                                    self.rect.right, self.rect.bottom)
+        angle = self.angle
+        mask = 0
 
         for rect in rects:
-            # Work out which corners of the ball rect are in contact.
-            tl = tl or rect.collidepoint(self.rect.topleft)
-            tr = tr or rect.collidepoint(self.rect.topright)
-            bl = bl or rect.collidepoint(self.rect.bottomleft)
-            br = br or rect.collidepoint(self.rect.bottomright)
-
-        if [tl, tr, bl, br].count(True) == 1:
+            # Work out which corners of the ball rect are in contact, by
+            # seeing which of the ball's columns (left, right) and rows
+            # (top, bottom) fall within the rect. These are combined into a
+            # mask with a bit for each corner: tl, tr, bl, br (lowest first).
+            x1, y1, x2, y2 = rect.left, rect.top, rect.right, rect.bottom
+            cols = (x1 <= left < x2) | (x1 <= right < x2) << 1
+            if y1 <= top < y2:
+                mask |= cols
+            if y1 <= bottom < y2:
+                mask |= cols << 2
+
+        tl, tr, bl, br = (bool(mask & 1), bool(mask & 2), bool(mask & 4),
+                          bool(mask & 8))
+
+        if CORNER_COUNTS[mask] == 1:
             # Corner collision, so work out whether this is a head on
             # corner collision, or if the ball has hit the corner obliquely.
             # Where oblique, we manually adjust the collide points so that
             # the ball doesn't bounce back in the direction from which it
             # came (a normal corner bounce), but bounces more naturally.
             if tl:
-                if self.angle > TWO_PI - HALF_PI:
+                if angle > TWO_PI - HALF_PI:
                     tr = True
-                elif self.angle < math.pi:
+                elif angle < PI:
                     bl = True
             elif tr:
-                if math.pi < self.angle < TWO_PI - HALF_PI:
+                if PI < angle < TWO_PI - HALF_PI:
                     tl = True
-                elif self.angle < HALF_PI:
+                elif angle < HALF_PI:
                     br = True
             elif bl:
-                if self.angle < HALF_PI:
+                if angle < HALF_PI:
                     br = True
-                elif self.angle > math.pi:
+                elif angle > PI:
                     tl = True
             elif br:
-                if math.pi > self.angle > HALF_PI:
+                if PI > angle > HALF_PI:
                     bl = True
-                elif self.angle > TWO_PI - HALF_PI:
+                elif angle > TWO_PI - HALF_PI:
                     tr = True
 
             if [tl, tr, bl, br].count(True) > 1:
@@ -10,6 +10,11 @@ from arkanoid.utils.util import (load_png,
 
 LOG = logging.getLogger(__name__)
 
+# The angles of bounce, in radians, corresponding to each of the 6 segments
+# of the paddle from left to right.
+BOUNCE_ANGLES = tuple(math.radians(angle) for angle in
+                      (220, 245, 260, 280, 295, 320))
+
 
 class Paddle(pygame.sprite.Sprite):
     """The movable paddle (a.k.a the "Vaus") used to control the ball to
@@ -74,32 +79,46 @@ class Paddle(pygame.sprite.Sprite):
         self._state.update()
 
         if self._move:
-            # Continuously move the paddle when the offset is non-zero.
-            newpos = self.rect.move(self._move, 0)
+            # Continuously move the paddle when the offset is non-zero. Only
+            # the x coordinate changes, so it is worked out arithmetically
+            # and set on the rect in place. If the full move would leave the
+            # area, which might leave a small gap, the speed is reduced so
+            # that we match the paddle up with the edge of the game area
+            # exactly.
+            x = self.rect.x
+            self.rect.x = self._clamp_to_area(x)
+            self._move = self.rect.x - x
+
+    def _clamp_to_area(self, x):
+        """Work out the position the paddle moves to, which is the position
+        nearest to the current movement target that keeps it within the area.
+
+        The paddle never moves further than the current speed, nor back
+        against the direction of travel. If there is no such position, the
+        paddle stays where it is.
 
-            if self._area_contains(newpos):
-                # But only update the position of the paddle if it's
-                # within the movable area.
-                self.rect = newpos
-            else:
-                # The new position is not within the screen area based on
-                # current speed, which might leave a small gap. Adjust the
-                # speed until we match the paddle up with the edge of the
-                # game area exactly.
-                while self._move != 0:
-                    if self._move < 0:
-                        self._move += 1
-                    else:
-                        self._move -= 1
-
-                    newpos = self.rect.move(self._move, 0)
-                    if self._area_contains(newpos):
-                        self.rect = newpos
-                        break
-
-    def _area_contains(self, newpos):
-        return self.area.collidepoint(newpos.midleft) and \
-               self.area.collidepoint(newpos.midright)
+        Args:
+            x:
+                The x coordinate of the paddle before it moved.
+        Returns:
+            The new x coordinate of the paddle.
+        """
+        area, rect, move = self.area, self.rect, self._move
+
+        if not area.top <= rect.centery < area.bottom:
+            return x
+
+        # The range of positions where both sides of the paddle are inside.
+        lowest, highest = area.left, area.right - 1 - rect.width
+
+        if move < 0:
+            new_x = max(x + move, lowest)
+        else:
+            new_x = min(x + move, highest)
+
+        if not lowest <= new_x <= highest or (new_x - x) * move < 0:
+            return x
+        return new_x
 
     def transition(self, state):
         """Transition to the specified state.
@@ -181,31 +200,15 @@ class Paddle(pygame.sprite.Sprite):
         """
         # Logically break the paddle into 6 segments.
         # Each segment triggers a different angle of bounce.
+        # The last segment makes up what is left of the paddle width.
         segment_size = paddle_rect.width // 6
-        segments = []
-
-        for i in range(6):
-            # Create rectangles for all segments bar the last.
-            left = paddle_rect.left + segment_size * i
-            if i < 5:
-                # These segments are a fixed size.
-                segment = pygame.Rect(left, paddle_rect.top, segment_size,
-                                      paddle_rect.height)
-            else:
-                # The last segment makes up what is left of the paddle width.
-                segment = pygame.Rect(left, paddle_rect.top,
-                                      paddle_rect.width - (segment_size * 5),
-                                      paddle_rect.height)
-            segments.append(segment)
-
-        # The bounce angles corresponding to each of the 8 segments.
-        angles = 220, 245, 260, 280, 295, 320
 
-        # Discover which segment the ball collided with. Just use the first.
-        index = ball_rect.collidelist(segments)
+        # Discover which segment the ball collided with. Just use the first
+        # (leftmost), which is the one beneath the ball's left edge.
+        offset = max(ball_rect.left - paddle_rect.left, 0)
+        index = min(offset // segment_size, 5)
 
-        # Look up the angle and convert it to radians, before returning.
-        return math.radians(angles[index])
+        return BOUNCE_ANGLES[index]
 
 
 class PaddleState:
@@ -0,0 +1,111 @@
+import collections
+
+# The default size of a grid cell, in pixels. This is roughly the size of a
+# brick, so that each brick occupies only a small number of cells.
+CELL_SIZE = 44
+
+
+class SpatialHash:
+    """A uniform grid that buckets sprites by the cells their rects occupy.
+
+    This allows the sprites close to a particular area of the screen to be
+    found without having to check every sprite. It is intended for sprites
+    that do not move once they have been inserted (e.g. bricks) - a sprite
+    that moves after insertion will still be bucketed by its old position.
+    """
+
+    def __init__(self, cell_size=CELL_SIZE):
+        """Initialise a new empty SpatialHash.
+
+        Args:
+            cell_size:
+                The width and height of each grid cell in pixels.
+        """
+        self._cell_size = cell_size
+
+        # The sprites in each cell, keyed by (cell_x, cell_y).
+        self._buckets = collections.defaultdict(list)
+
+        # The cells that each sprite occupies, keyed by the sprite.
+        self._cells = {}
+
+    def insert(self, sprite):
+        """Insert a sprite into the grid, using the sprite's rect to
+        determine the cells it occupies.
+
+        Args:
+            sprite:
+                The sprite to insert. It must have a rect attribute.
+        """
+        cells = self._cells_for(sprite.rect)
+        for cell in cells:
+            self._buckets[cell].append(sprite)
+        self._cells[sprite] = cells
+
+    def remove(self, sprite):
+        """Remove a sprite from the grid.
+
+        If the sprite is not in the grid, this method will just return
+        without doing anything.
+
+        Args:
+            sprite:
+                The sprite to remove.
+        """
+        for cell in self._cells.pop(sprite, ()):
+            bucket = self._buckets[cell]
+            bucket.remove(sprite)
+            if not bucket:
+                del self._buckets[cell]
+
+    def clear(self):
+        """Remove all sprites from the grid."""
+        self._buckets.clear()
+        self._cells.clear()
+
+    def query(self, rect):
+        """Find the sprites that occupy the same cells as the given rect.
+
+        Note that the sprites returned are only candidates - they share a
+        cell with the rect but their own rects may not actually overlap it.
+
+        Args:
+            rect:
+                The Rect to find the neighbouring sprites of.
+        Returns:
+            A list of the candidate sprites, without duplicates.
+        """
+        buckets = self._buckets
+        size = self._cell_size
+        x, y = rect.left // size, rect.top // size
+
+        if (x == (rect.right - 1) // size and
+                y == (rect.bottom - 1) // size):
+            # The rect sits within a single cell, which is the usual case
+            # for a small rect such as the ball's. Most cells away from the
+            # bricks are empty, so this is often all that needs checking.
+            if (x, y) in buckets:
+                return list(buckets[(x, y)])
+            return []
+
+        candidates = []
+        for cell in self._cells_for(rect):
+            if cell in buckets:
+                candidates += buckets[cell]
+        if len(candidates) > 1:
+            # A sprite spanning several cells will appear more than once.
+            candidates = list(dict.fromkeys(candidates))
+        return candidates
+
+    def _cells_for(self, rect):
+        """Get the cells that the given rect occupies."""
+        size = self._cell_size
+        columns = range(rect.left // size, (rect.right - 1) // size + 1)
+        rows = range(rect.top // size, (rect.bottom - 1) // size + 1)
+        return [(x, y) for x in columns for y in rows]
+
+    def __contains__(self, sprite):
+        return sprite in self._cells
+
+    def __len__(self):
+        return len(self._cells)
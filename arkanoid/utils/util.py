@@ -11,6 +11,10 @@ def load_png(filename):
     """Load a png image with the specified filename from the
     data/graphics directory and return it and its Rect.
 
+    An image is only read from disk the first time it is loaded. Subsequent
+    loads return the same image, which must therefore not be modified, but
+    always with a new Rect.
+
     Args:
         filename:
             The filename of the image, with or without the '.png' extension.
@@ -21,18 +25,26 @@ def load_png(filename):
     """
     if not filename.lower().endswith('.png'):
         filename = '{}.png'.format(filename)
+
+    image = _load_image(filename)
+
+    return image, image.get_rect()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_image(filename):
     fullpath = os.path.join(os.path.dirname(__file__), '..', 'data',
                             'graphics', filename)
     if not os.path.exists(fullpath):
         raise FileNotFoundError('File not found: {}'.format(fullpath))
 
     image = pygame.image.load(fullpath)
-    if image.get_alpha is None:
+    if image.get_alpha() is None:
         image = image.convert()
     else:
         image = image.convert_alpha()
 
-    return image, image.get_rect()
+    return image
 
 
 def load_png_sequence(filename_prefix):
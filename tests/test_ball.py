@@ -24,13 +24,23 @@ class TestBall(TestCase):
 
         return mock_sprite
 
+    def _collide_at(self, ball, *points):
+        """Make the ball collide with a single pixel sprite at each of the
+        supplied points.
+        """
+        sprites = []
+        for point in points:
+            sprite = Mock()
+            sprite.rect = pygame.Rect(point, (1, 1))
+            ball.add_collidable_sprite(sprite)
+            sprites.append(sprite)
+        ball._detect_collisions = Mock(return_value=sprites)
+
     @patch('arkanoid.sprites.ball.load_png')
     @patch('arkanoid.sprites.ball.pygame')
     def test_calculate_new_position(self, mock_pygame, mock_load_png):
         self._configure_mocks(mock_pygame, mock_load_png)
 
-        mock_pygame.sprite.spritecollide.return_value = []
-
         ball = Ball((100, 100), 2.36, 8)
         ball.update()
 
@@ -46,7 +56,6 @@ class TestBall(TestCase):
                                        mock_load_png):
         self._configure_mocks(mock_pygame, mock_load_png, offscreen=False)
 
-        mock_pygame.sprite.spritecollide.return_value = []
         mock_offscreen_callback = Mock()
 
         ball = Ball((100, 100), 2.36, 8,
@@ -62,8 +71,6 @@ class TestBall(TestCase):
                                                      mock_load_png):
         self._configure_mocks(mock_pygame, mock_load_png)
 
-        mock_pygame.sprite.spritecollide.return_value = []
-
         ball = Ball((100, 100), 2.36, 8, normalisation_rate=0.03)
         ball.speed = 12  # Increase the speed above the base speed.
 
@@ -77,8 +84,6 @@ class TestBall(TestCase):
                                                    mock_load_png):
         self._configure_mocks(mock_pygame, mock_load_png)
 
-        mock_pygame.sprite.spritecollide.return_value = []
-
         ball = Ball((100, 100), 2.36, 8, normalisation_rate=0.03)
         ball.speed = 5  # Reduce the speed below the base speed.
 
@@ -99,7 +104,7 @@ class TestBall(TestCase):
                                    speed_adjust=0.05,
                                    on_collide=mock_on_collide)
 
-        ball._collidable_sprites.add.assert_called_once_with(mock_sprite)
+        self.assertIn(mock_sprite, ball._collision_data)
         self.assertEqual(len(ball._collision_data), 1)
 
     @patch('arkanoid.sprites.ball.load_png')
@@ -120,7 +125,7 @@ class TestBall(TestCase):
                                    on_collide=mock_on_collide)
         ball.remove_collidable_sprite(mock_sprite1)
 
-        ball._collidable_sprites.remove.assert_called_once_with(mock_sprite1)
+        self.assertNotIn(mock_sprite1, ball._collision_data)
         self.assertEqual(len(ball._collision_data), 1)
 
     @patch('arkanoid.sprites.ball.load_png')
@@ -138,7 +143,7 @@ class TestBall(TestCase):
                                    on_collide=mock_on_collide)
         ball.remove_collidable_sprite(mock_sprite1)  # Does not exist.
 
-        ball._collidable_sprites.remove.assert_called_once_with(mock_sprite1)
+        self.assertNotIn(mock_sprite1, ball._collision_data)
         self.assertEqual(len(ball._collision_data), 1)
 
     @patch('arkanoid.sprites.ball.load_png')
@@ -159,7 +164,6 @@ class TestBall(TestCase):
                                    on_collide=mock_on_collide)
         ball.remove_all_collidable_sprites()
 
-        ball._collidable_sprites.empty.assert_called_once_with()
         self.assertEqual(len(ball._collision_data), 0)
 
     @patch('arkanoid.sprites.ball.load_png')
@@ -172,14 +176,13 @@ class TestBall(TestCase):
         mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
         mock_bounce, mock_on_collide = Mock(), Mock()
 
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
         mock_bounce.return_value = 2.4
 
         ball = Ball((100, 100), 2.36, 8)
         ball.add_collidable_sprite(mock_sprite, bounce_strategy=mock_bounce,
                                    speed_adjust=0.5,
                                    on_collide=mock_on_collide)
+        ball._detect_collisions = Mock(return_value=[mock_sprite])
         ball.update()
 
         self.assertEqual(ball.speed, 8.5)
@@ -197,13 +200,13 @@ class TestBall(TestCase):
         """
         mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
         mock_on_collide, mock_calc_new_angle = Mock(), Mock()
-
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
+        mock_calc_new_angle.return_value = 3.2
 
         ball = Ball((100, 100), 2.36, 8)
         ball.add_collidable_sprite(mock_sprite, speed_adjust=0.5,
                                    on_collide=mock_on_collide)
         ball._calc_new_angle = mock_calc_new_angle
+        ball._detect_collisions = Mock(return_value=[mock_sprite])
         ball.update()
 
         self.assertEqual(ball.speed, 8.5)
@@ -224,11 +227,8 @@ class TestBall(TestCase):
          mock_sprite2,
          mock_sprite3) = (Mock(), Mock(), Mock(), Mock(), Mock())
 
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite,
-                                                         mock_sprite2,
-                                                         mock_sprite3]
-
         mock_bounce.return_value = 3.2
+        mock_calc_new_angle.return_value = 3.2
 
         ball = Ball((100, 100), 2.36, 8, top_speed=9)
         ball.add_collidable_sprite(mock_sprite, bounce_strategy=mock_bounce,
@@ -241,6 +241,8 @@ class TestBall(TestCase):
                                    speed_adjust=0.5,
                                    on_collide=mock_on_collide)
         ball._calc_new_angle = mock_calc_new_angle
+        ball._detect_collisions = Mock(
+            return_value=[mock_sprite, mock_sprite2, mock_sprite3])
         ball.update()
 
         self.assertEqual(ball.speed, 9.0)  # Gone up, but not above top speed.
@@ -257,17 +259,10 @@ class TestBall(TestCase):
         """Test that the default bounce calculation correctly calculates
         the angle when the ball collides with a single corner of a sprite.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            return point == (95.0, 95.0)
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 3.92, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (95, 95))
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 0.78 - RANDOM_RANGE)
@@ -282,17 +277,10 @@ class TestBall(TestCase):
         but the angle of collision is horizontally oblique against the top
         left corner of the ball, rather than head on.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            return point == (104.0, 94.0)  # Top left corner
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100),  5.3, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (104, 94))  # Top left corner
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 0.98 - RANDOM_RANGE)
@@ -307,17 +295,10 @@ class TestBall(TestCase):
         but the angle of collision is horizontally oblique against the top
         right corner of the ball, rather than head on.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            return point == (115.0, 105.0)  # Top right corner.
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100),  0.78, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (115, 105))  # Top right corner
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 2.36 - RANDOM_RANGE)
@@ -332,17 +313,10 @@ class TestBall(TestCase):
         but the angle of collision is vertically oblique against the top
         left corner of the ball, rather than head on.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            return point == (95.0, 105.0)  # Top left corner.
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100),  2.35, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (95, 105))  # Top left corner
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 0.78 - RANDOM_RANGE)
@@ -357,17 +331,10 @@ class TestBall(TestCase):
         but the angle of collision is vertically oblique against the top
         right corner of the ball, rather than head on.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            return point == (115.0, 105.0)  # Top right corner.
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100),  0.78, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (115, 105))  # Top right corner
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 2.36 - RANDOM_RANGE)
@@ -382,17 +349,10 @@ class TestBall(TestCase):
         but the angle of collision is horizontally oblique against the bottom
         left corner of the ball, rather than head on.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            return point == (105.0, 115.0)  # Bottom left corner
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 0.78, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (105, 115))  # Bottom left corner
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 5.5 - RANDOM_RANGE)
@@ -407,17 +367,10 @@ class TestBall(TestCase):
         but the angle of collision is horizontally oblique against the bottom
         right corner of the ball, rather than head on.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            return point == (105.0, 115.0)  # Bottom right corner
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 2.36, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (105, 115))  # Bottom right corner
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 3.92 - RANDOM_RANGE)
@@ -432,17 +385,10 @@ class TestBall(TestCase):
         but the angle of collision is vertically oblique against the bottom
         left corner of the ball, rather than head on.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            return point == (95.0, 105.0)  # Bottom left corner
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 3.92, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (95, 105))  # Bottom left corner
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 5.5 - RANDOM_RANGE)
@@ -457,17 +403,10 @@ class TestBall(TestCase):
         but the angle of collision is vertically oblique against the bottom
         right corner of the ball, rather than head on.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            return point == (115.0, 105.0)  # Bottom left corner
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 5.5, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (115, 105))  # Bottom left corner
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 3.92 - RANDOM_RANGE)
@@ -479,17 +418,10 @@ class TestBall(TestCase):
         """Test that the default bounce calculation correctly calculates
         the angle when the ball collides with three corners of a sprite.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            points = [(95.0, 94.0), (105.0, 94.0), (95.0, 104.0)]
-            return point in points
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 4.01, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (95, 94), (105, 94), (95, 104))
         ball.update()
 
         self.assertAlmostEqual(ball.angle, 0.87, places=2)
@@ -502,12 +434,11 @@ class TestBall(TestCase):
         effectively inside the sprite).
         """
         mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        mock_sprite.rect.collidepoint.return_value = True
+        mock_sprite.rect = pygame.Rect(80, 80, 40, 40)
 
         ball = Ball((100, 100), 4.01, 8)
         ball.add_collidable_sprite(mock_sprite)
+        ball._detect_collisions = Mock(return_value=[mock_sprite])
         ball.update()
 
         self.assertAlmostEqual(ball.angle, 0.87, places=2)
@@ -518,17 +449,10 @@ class TestBall(TestCase):
         """Test that the default bounce calculation correctly calculates
         the angle when the top of the ball collides with another sprite.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            points = [(95.0, 94.0), (105.0, 94.0)]
-            return point in points
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 4.01, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (95, 94), (105, 94))
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 2.27 - RANDOM_RANGE)
@@ -540,17 +464,10 @@ class TestBall(TestCase):
         """Test that the default bounce calculation correctly calculates
         the angle when the bottom of the ball collides with another sprite.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            points = [(95.0, 115.0), (105.0, 115.0)]
-            return point in points
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 2.32, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (95, 115), (105, 115))
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 3.96 - RANDOM_RANGE)
@@ -567,17 +484,10 @@ class TestBall(TestCase):
         for a top collision to occur, the ball must be travelling at an angle
         greater than 3.14. An angle less than this would be an invalid state.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            points = [(95.0, 105.0), (105.0, 105.0)]
-            return point in points
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 2.32, 8)  # Angle is incorrect for top collide
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (95, 105), (105, 105))
         ball.update()
 
         # Due to the invalid state, the ball's angle is not recalculated.
@@ -591,17 +501,10 @@ class TestBall(TestCase):
         the angle when the left of the ball collides with another sprite and
         the current angle is less than PI.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            points = [(95.0, 105.0), (95.0, 115.0)]
-            return point in points
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 2.32, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (95, 105), (95, 115))
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 0.82 - RANDOM_RANGE)
@@ -614,17 +517,10 @@ class TestBall(TestCase):
         the angle when the left of the ball collides with another sprite and
         the current angle is greater than PI.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            points = [(95.0, 94.0), (95.0, 104.0)]
-            return point in points
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 4.01, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (95, 94), (95, 104))
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 5.41 - RANDOM_RANGE)
@@ -641,17 +537,10 @@ class TestBall(TestCase):
         for a left collision to occur, the ball must be travelling at an angle
         greater than 1.57 and less than 4.71.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            points = [(101.0, 93.0), (101.0, 103.0)]
-            return point in points
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 4.9, 8)  # Invalid angle for left collision.
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (101, 93), (101, 103))
         ball.update()
 
         # Due to the invalid state, the ball's angle is not recalculated.
@@ -666,17 +555,10 @@ class TestBall(TestCase):
         the angle when the right of the ball collides with another sprite and
         the current angle is less than PI.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            points = [(112.0, 107.0), (112.0, 117.0)]
-            return point in points
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 1.2, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (112, 107), (112, 117))
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 1.94 - RANDOM_RANGE)
@@ -690,17 +572,10 @@ class TestBall(TestCase):
         the angle when the right of the ball collides with another sprite and
         the current angle is greater than PI.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            points = [(111.0, 93.0), (111.0, 103.0)]
-            return point in points
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 4.9, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (111, 93), (111, 103))
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 4.5 - RANDOM_RANGE)
@@ -717,17 +592,10 @@ class TestBall(TestCase):
         for a right collision to occur, the ball must be travelling at an angle
         greater than 4.71 or less than 1.57.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            points = [(111.0, 93.0), (111.0, 103.0)]
-            return point in points
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 2.32, 8)  # Invalid angle for right collision.
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (111, 93), (111, 103))
         ball.update()
 
         # Due to the invalid state, the ball's angle is not recalculated.
@@ -742,17 +610,10 @@ class TestBall(TestCase):
         vertical angle, that the angle of bounce is adjusted to more that
         what it would naturally be. This is to overcome bounce loops.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            points = [(100.0, 93.0), (110.0, 93.0)]
-            return point in points
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 4.71, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (100, 93), (110, 93))
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 1.92 - RANDOM_RANGE)
@@ -766,17 +627,10 @@ class TestBall(TestCase):
         vertical angle, that the angle of bounce is adjusted to more that
         what it would naturally be. This is to overcome bounce loops.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            points = [(100.0, 117.0), (110.0, 117.0)]
-            return point in points
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 1.57, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (100, 117), (110, 117))
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 5.06 - RANDOM_RANGE)
@@ -790,17 +644,10 @@ class TestBall(TestCase):
         horizontal angle, that the angle of bounce is adjusted to more that
         what it would naturally be. This is to overcome bounce loops.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            points = [(93.0, 100.0), (93.0, 110.0)]
-            return point in points
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 3.18, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (93, 100), (93, 110))
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 5.89 - RANDOM_RANGE)
@@ -814,17 +661,10 @@ class TestBall(TestCase):
         horizontal angle, that the angle of bounce is adjusted to more that
         what it would naturally be. This is to overcome bounce loops.
         """
-        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
-        mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
-
-        def collidepoint(point):
-            points = [(117.0, 100.0), (117.0, 110.0)]
-            return point in points
-
-        mock_sprite.rect.collidepoint.side_effect = collidepoint
+        self._configure_mocks(mock_pygame, mock_load_png)
 
         ball = Ball((100, 100), 6.25, 8)
-        ball.add_collidable_sprite(mock_sprite)
+        self._collide_at(ball, (117, 100), (117, 110))
         ball.update()
 
         self.assertGreaterEqual(ball.angle, 3.52 - RANDOM_RANGE)
@@ -838,7 +678,6 @@ class TestBall(TestCase):
         ball = Ball((100, 100), 2.32, 8)
 
         sprite, bounce, on_collide, offscreen = Mock(), Mock(), Mock(), Mock()
-        ball._collidable_sprites.__iter__.return_value = [sprite]
 
         ball.add_collidable_sprite(sprite,
                                    bounce_strategy=bounce,
@@ -858,7 +697,7 @@ class TestBall(TestCase):
         self.assertEqual(clone._top_speed, 14)
         self.assertEqual(clone.normalisation_rate, 0.3)
         self.assertEqual(clone._off_screen_callback, offscreen)
-        clone._collidable_sprites.add.assert_has_calls([call(sprite)])
+        self.assertIn(sprite, clone._collision_data)
         self.assertEqual(clone._collision_data, ball._collision_data)
 
     @patch('arkanoid.sprites.ball.load_png')
@@ -869,15 +708,13 @@ class TestBall(TestCase):
         """
         self._configure_mocks(mock_pygame, mock_load_png)
 
-        mock_pygame.sprite.spritecollide.return_value = []
-
         ball = Ball((100, 100), 2.32, 8)
         ball.anchor((200, 200))
         ball.update()
 
-        # Assert that a new Rectangle mock was called with the fixed
-        # position and dimensions of the anchored ball.
-        mock_pygame.Rect.assert_called_once_with((200, 200), (10, 10))
+        # Assert that the ball was moved to the fixed position, keeping
+        # its dimensions.
+        self.assertEqual(ball.rect, pygame.Rect(200, 200, 10, 10))
 
     @patch('arkanoid.sprites.ball.load_png')
     @patch('arkanoid.sprites.ball.pygame')
@@ -889,15 +726,28 @@ class TestBall(TestCase):
         mock_sprite.rect.left = 305
         mock_sprite.rect.top = 429
 
-        mock_pygame.sprite.spritecollide.return_value = []
-
         ball = Ball((100, 100), 2.32, 8)
         ball.anchor(mock_sprite, rel_pos=(5, 5))
         ball.update()
 
-        # Assert that a new Rectangle mock was called with the position
-        # of the sprite taking into account the relative position.
-        mock_pygame.Rect.assert_called_once_with(305 + 5, 429 + 5, 10, 10)
+        # Assert that the ball was moved to the position of the sprite
+        # taking into account the relative position.
+        self.assertEqual(ball.rect, pygame.Rect(305 + 5, 429 + 5, 10, 10))
+
+    @patch('arkanoid.sprites.ball.load_png')
+    @patch('arkanoid.sprites.ball.pygame')
+    def test_anchor_sprite_centre(self, mock_pygame, mock_load_png):
+        """Test that the ball is centred on a sprite when anchored without
+        a relative position.
+        """
+        mock_sprite = self._configure_mocks(mock_pygame, mock_load_png)
+        mock_sprite.rect = pygame.Rect(300, 420, 40, 20)
+
+        ball = Ball((100, 100), 2.32, 8)
+        ball.anchor(mock_sprite)
+        ball.update()
+
+        self.assertEqual(ball.rect.center, (320, 430))
 
     @patch('arkanoid.sprites.ball.load_png')
     @patch('arkanoid.sprites.ball.pygame')
@@ -909,13 +759,60 @@ class TestBall(TestCase):
         mock_sprite.rect.left = 305
         mock_sprite.rect.top = 429
 
-        mock_pygame.sprite.spritecollide.return_value = []
-
         ball = Ball((100, 100), 2.32, 8)
         ball.anchor(mock_sprite, rel_pos=(5, 5))
+        ball._detect_collisions = Mock()
         ball.update()
 
-        self.assertEqual(mock_pygame.sprite.spritecollide.call_count, 0)
+        self.assertEqual(ball._detect_collisions.call_count, 0)
+
+    @patch('arkanoid.sprites.ball.load_png')
+    @patch('arkanoid.sprites.ball.pygame')
+    def test_detect_collisions(self, mock_pygame, mock_load_png):
+        """Test that only visible sprites whose rects overlap the ball are
+        detected as collided.
+        """
+        self._configure_mocks(mock_pygame, mock_load_png)
+        hit, hidden, missed = Mock(), Mock(), Mock()
+        hit.rect, hit.visible = pygame.Rect(95, 95, 10, 10), True
+        hidden.rect, hidden.visible = pygame.Rect(105, 105, 10, 10), False
+        missed.rect, missed.visible = pygame.Rect(300, 300, 10, 10), True
+
+        ball = Ball((100, 100), 2.32, 8)
+        ball.add_collidable_sprite(hit)
+        ball.add_collidable_sprite(hidden)
+        ball.add_collidable_sprite(missed)
+
+        self.assertEqual(ball._detect_collisions(), [hit])
+
+        ball.remove_collidable_sprite(hit)
+
+        self.assertEqual(ball._detect_collisions(), [])
+
+    @patch('arkanoid.sprites.ball.load_png')
+    @patch('arkanoid.sprites.ball.pygame')
+    def test_detect_collisions_static(self, mock_pygame, mock_load_png):
+        """Test that static sprites are detected when near the ball, and
+        that collided sprites are returned in the order they were added.
+        """
+        self._configure_mocks(mock_pygame, mock_load_png)
+        dynamic, static, distant = Mock(), Mock(), Mock()
+        dynamic.rect = pygame.Rect(95, 95, 10, 10)
+        static.rect = pygame.Rect(105, 105, 43, 21)
+        distant.rect = pygame.Rect(500, 500, 43, 21)
+
+        ball = Ball((100, 100), 2.32, 8)
+        ball.add_collidable_sprite(static, static=True)
+        ball.add_collidable_sprite(distant, static=True)
+        ball.add_collidable_sprite(dynamic)
+
+        self.assertEqual(ball._detect_collisions(), [static, dynamic])
+        self.assertIn(static, ball._static_sprites)
+
+        ball.remove_collidable_sprite(static)
+
+        self.assertEqual(ball._detect_collisions(), [dynamic])
+        self.assertNotIn(static, ball._static_sprites)
 
     @patch('arkanoid.sprites.ball.load_png')
     @patch('arkanoid.sprites.ball.pygame')
@@ -923,8 +820,6 @@ class TestBall(TestCase):
         """Test that an anchored ball is released."""
         self._configure_mocks(mock_pygame, mock_load_png)
 
-        mock_pygame.sprite.spritecollide.return_value = []
-
         ball = Ball((100, 100), 2.32, 8)
         ball.anchor((200, 200))
         ball.update()
@@ -1,6 +1,5 @@
 from unittest import TestCase
-from unittest.mock import (call,
-                           Mock,
+from unittest.mock import (Mock,
                            patch)
 
 from arkanoid.rounds.base import BaseRound
@@ -15,10 +14,10 @@ class TestBaseRound(TestCase):
             mock_pygame)
 
         base_round = BaseRound(top_offset=150)
-        base_round._blit_brick(mock_brick, x=0, y=0)
+        base_round._position_brick(mock_brick, x=0, y=0)
 
-        mock_screen.blit.assert_has_calls([call(mock_background, (0, 150)),
-                                           call(mock_brick.image, (15, 165))])
+        mock_screen.blit.assert_called_once_with(mock_background, (0, 150))
+        self.assertEqual(mock_brick.rect.topleft, (15, 165))
 
     @patch('arkanoid.rounds.base.pygame')
     def test_sets_brick_in_position_1_1(self, mock_pygame):
@@ -26,10 +25,10 @@ class TestBaseRound(TestCase):
             mock_pygame)
 
         base_round = BaseRound(top_offset=150)
-        base_round._blit_brick(mock_brick, x=1, y=1)
+        base_round._position_brick(mock_brick, x=1, y=1)
 
-        mock_screen.blit.assert_has_calls([call(mock_background, (0, 150)),
-                                           call(mock_brick.image, (57, 186))])
+        mock_screen.blit.assert_called_once_with(mock_background, (0, 150))
+        self.assertEqual(mock_brick.rect.topleft, (57, 186))
 
     @patch('arkanoid.rounds.base.pygame')
     def test_sets_brick_in_position_9_13(self, mock_pygame):
@@ -37,10 +36,22 @@ class TestBaseRound(TestCase):
             mock_pygame)
 
         base_round = BaseRound(top_offset=150)
-        base_round._blit_brick(mock_brick, x=9, y=13)
+        base_round._position_brick(mock_brick, x=9, y=13)
 
-        mock_screen.blit.assert_has_calls([call(mock_background, (0, 150)),
-                                           call(mock_brick.image, (393, 438))])
+        mock_screen.blit.assert_called_once_with(mock_background, (0, 150))
+        self.assertEqual(mock_brick.rect.topleft, (393, 438))
+
+    @patch('arkanoid.rounds.base.pygame')
+    def test_blits_bricks_together(self, mock_pygame):
+        mock_screen, _, mock_brick = self._setup_mocks(mock_pygame)
+        mock_brick2 = Mock()
+        BaseRound._create_bricks.return_value = [mock_brick, mock_brick2]
+
+        BaseRound(top_offset=150)
+
+        mock_screen.blits.assert_called_once_with(
+            [(mock_brick.image, mock_brick.rect),
+             (mock_brick2.image, mock_brick2.rect)], doreturn=False)
 
     def _setup_mocks(self, mock_pygame):
         mock_screen = Mock()
@@ -56,6 +67,7 @@ class TestBaseRound(TestCase):
         mock_create_background = Mock()
         mock_create_background.return_value = mock_background
         mock_create_bricks = Mock()
+        mock_create_bricks.return_value = []
         BaseRound._create_edges = mock_create_edges
         BaseRound._create_background = mock_create_background
         BaseRound._create_bricks = mock_create_bricks
@@ -1,4 +1,6 @@
 from unittest import TestCase
+from unittest.mock import (Mock,
+                           patch)
 
 from arkanoid.event import receiver
 
@@ -29,15 +31,49 @@ class TestEventReceiver(TestCase):
         with self.assertRaises(AssertionError):
             receiver.register_handler('foo')
 
+    @patch('arkanoid.event.pygame')
+    def test_receive(self, mock_pygame):
+        handler, other_handler = Mock(), Mock()
+        event, other_event = Mock(type='receive_event'), Mock(type='other')
+        mock_pygame.event.get.return_value = [event, other_event]
+        receiver.register_handler('receive_event', handler)
+        receiver.register_handler('other', other_handler)
+
+        try:
+            receiver.receive()
+        finally:
+            receiver.unregister_handler(handler, other_handler)
+
+        handler.assert_called_once_with(event)
+        other_handler.assert_called_once_with(other_event)
+
+    @patch('arkanoid.event.pygame')
+    def test_receive_handler_unregisters_itself(self, mock_pygame):
+        other_handler = Mock()
+
+        def handler(event):
+            receiver.unregister_handler(handler)
+
+        receiver.register_handler('receive_event', handler, other_handler)
+        event = Mock(type='receive_event')
+        mock_pygame.event.get.return_value = [event]
+
+        try:
+            receiver.receive()
+        finally:
+            receiver.unregister_handler(other_handler)
+
+        other_handler.assert_called_once_with(event)
+
     def test_unregister_handler(self):
         def handler():
             pass
 
-        receiver._handlers['test_event'].append(handler)
+        receiver.register_handler('test_event', handler)
 
         receiver.unregister_handler(handler)
 
-        self.assertNotIn(handler, receiver._handlers['test_event'])
+        self.assertNotIn(handler, receiver._handlers.get('test_event', ()))
 
     def test_unregister_multiple_handlers(self):
         def handler1():
@@ -46,12 +82,22 @@ class TestEventReceiver(TestCase):
         def handler2():
             pass
 
-        receiver._handlers['test_event'] += handler1, handler2
+        receiver.register_handler('test_event', handler1, handler2)
 
         receiver.unregister_handler(handler1, handler2)
 
-        self.assertNotIn(handler1, receiver._handlers['test_event'])
-        self.assertNotIn(handler2, receiver._handlers['test_event'])
+        self.assertNotIn(handler1, receiver._handlers.get('test_event', ()))
+        self.assertNotIn(handler2, receiver._handlers.get('test_event', ()))
+
+    def test_unregister_handler_removes_empty_event_type(self):
+        def handler():
+            pass
+
+        receiver.register_handler('empty_event', handler)
+
+        receiver.unregister_handler(handler)
+
+        self.assertNotIn('empty_event', receiver._handlers)
 
     def test_unregister_handler_raises_exception_when_no_handler(self):
         with self.assertRaises(AssertionError):
@@ -0,0 +1,302 @@
+from unittest import TestCase
+from unittest.mock import (Mock,
+                           patch)
+
+import pygame
+
+from arkanoid.game import (Arkanoid,
+                           Game,
+                           logic_steps,
+                           MAX_LOGIC_STEPS)
+
+
+class TestLogicSteps(TestCase):
+
+    def test_one_step_per_frame(self):
+        steps, lag = logic_steps(1000 / 60)
+
+        self.assertEqual(steps, 1)
+        self.assertEqual(lag, 0)
+
+    def test_one_step_when_frame_is_early(self):
+        steps, lag = logic_steps(10)
+
+        self.assertEqual(steps, 1)
+        self.assertEqual(lag, 0)
+
+    def test_catches_up_after_slow_frame(self):
+        steps, lag = logic_steps(40)
+
+        self.assertEqual(steps, 2)
+        self.assertAlmostEqual(lag, 40 - 2 * 1000 / 60)
+
+    def test_keeps_remaining_lag(self):
+        steps, lag = logic_steps(1000 / 60 * 1.4)
+
+        self.assertEqual(steps, 1)
+        self.assertAlmostEqual(lag, 1000 / 60 * 0.4)
+
+    def test_limits_steps_after_long_pause(self):
+        steps, lag = logic_steps(5000)
+
+        self.assertEqual(steps, MAX_LOGIC_STEPS)
+        self.assertAlmostEqual(lag, 1000 / 60)
+
+
+class TestGame(TestCase):
+
+    def setUp(self):
+        # Create the game without running __init__(), which needs a display.
+        self.game = Game.__new__(Game)
+        self.game.paddle = Mock()
+        self.game.round = Mock()
+        self.game.round.edges.left.rect.width = 20
+        self.game.sprites = []
+        self.game.static_sprites = {}
+        self.game.dirty_rects = []
+        self.game.lives = 3
+        self.game._life_img = Mock()
+        self.game._life_rects = []
+        self.game._lives_drawn = None
+        self.game._life_top = 780
+        self.game._life_step = 40
+
+        def blits(blit_sequence, doreturn=True):
+            # Return the areas drawn to, like the real blits().
+            rects = [pygame.Rect(dest) if len(dest) == 4
+                     else pygame.Rect(dest, (35, 10))
+                     for _, dest, *_ in blit_sequence]
+            return rects if doreturn else None
+
+        self.game._screen = Mock()
+        self.game._screen.blits.side_effect = blits
+
+    @patch('arkanoid.game.pygame.key.get_pressed')
+    def test_move_paddle_left(self, mock_get_pressed):
+        mock_get_pressed.return_value = {pygame.K_LEFT: True,
+                                         pygame.K_RIGHT: False}
+
+        self.game._move_paddle()
+
+        self.game.paddle.move_left.assert_called_once_with()
+        self.game.paddle.move_right.assert_not_called()
+
+    @patch('arkanoid.game.pygame.key.get_pressed')
+    def test_move_paddle_right(self, mock_get_pressed):
+        mock_get_pressed.return_value = {pygame.K_LEFT: False,
+                                         pygame.K_RIGHT: True}
+
+        self.game._move_paddle()
+
+        self.game.paddle.move_right.assert_called_once_with()
+        self.game.paddle.move_left.assert_not_called()
+
+    @patch('arkanoid.game.pygame.key.get_pressed')
+    def test_move_paddle_stops_when_no_keys_held(self, mock_get_pressed):
+        mock_get_pressed.return_value = {pygame.K_LEFT: False,
+                                         pygame.K_RIGHT: False}
+
+        self.game._move_paddle()
+
+        self.game.paddle.stop.assert_called_once_with()
+
+    @patch('arkanoid.game.pygame.key.get_pressed')
+    def test_move_paddle_stops_when_both_keys_held(self, mock_get_pressed):
+        mock_get_pressed.return_value = {pygame.K_LEFT: True,
+                                         pygame.K_RIGHT: True}
+
+        self.game._move_paddle()
+
+        self.game.paddle.stop.assert_called_once_with()
+        self.game.paddle.move_left.assert_not_called()
+        self.game.paddle.move_right.assert_not_called()
+
+    def test_draw_sprites_draws_moving_sprites(self):
+        ball = self._sprite((100, 100, 10, 10))
+        self.game.sprites.append(ball)
+
+        self.game._draw_sprites()
+
+        self.assertEqual(self._drawn(), [ball.image])
+        self.assertIn(ball.rect, self.game.dirty_rects)
+
+    def test_draw_sprites_skips_unchanged_static_sprites(self):
+        brick = self._static_sprite((20, 150, 40, 20))
+        ball = self._sprite((100, 300, 10, 10))
+        self.game.sprites += brick, ball
+
+        self.game._draw_sprites()
+
+        self.assertEqual(self._erased(), [])
+        self.assertEqual(self._drawn(), [ball.image])
+        self.assertEqual(self.game.dirty_rects, [ball.rect])
+
+    def test_draw_sprites_redraws_changed_static_sprite(self):
+        brick = self._static_sprite((20, 150, 40, 20))
+        brick.image = Mock()
+        self.game.sprites.append(brick)
+
+        self.game._draw_sprites()
+
+        self.assertEqual(self._erased(), [brick.rect])
+        self.assertEqual(self._drawn(), [brick.image])
+        self.assertEqual(self.game.static_sprites[brick],
+                         (brick.image, True))
+
+    def test_draw_sprites_erases_hidden_static_sprite(self):
+        brick = self._static_sprite((20, 150, 40, 20))
+        brick.visible = False
+        self.game.sprites.append(brick)
+
+        self.game._draw_sprites()
+
+        self.assertEqual(self._erased(), [brick.rect])
+        self.assertEqual(self._drawn(), [])
+        self.assertEqual(self.game.static_sprites[brick],
+                         (brick.image, False))
+
+    def test_draw_sprites_redraws_static_sprite_under_moving_sprite(self):
+        brick = self._static_sprite((20, 150, 40, 20))
+        ball = self._sprite((55, 165, 10, 10))
+        self.game.sprites += brick, ball
+
+        self.game._draw_sprites()
+
+        self.assertEqual(self._erased(), [brick.rect])
+        self.assertEqual(self._drawn(), [brick.image, ball.image])
+
+    def test_draw_sprites_redraws_static_sprite_under_dirty_rect(self):
+        brick = self._static_sprite((20, 150, 40, 20))
+        self.game.sprites.append(brick)
+        self.game.dirty_rects.append(pygame.Rect(30, 140, 10, 20))
+
+        self.game._draw_sprites()
+
+        self.assertEqual(self._erased(), [brick.rect])
+        self.assertEqual(self._drawn(), [brick.image])
+
+    def test_draw_sprites_redraws_overlapping_static_sprites(self):
+        edge = self._static_sprite((0, 150, 23, 650))
+        brick1 = self._static_sprite((20, 150, 40, 20))
+        brick2 = self._static_sprite((58, 150, 40, 20))
+        brick3 = self._static_sprite((140, 150, 40, 20))
+        ball = self._sprite((10, 500, 10, 10))
+        self.game.sprites += edge, brick1, brick2, brick3, ball
+
+        self.game._draw_sprites()
+
+        self.assertCountEqual(self._erased(),
+                              [edge.rect, brick1.rect, brick2.rect])
+        self.assertEqual(self._drawn(), [edge.image, brick1.image,
+                                         brick2.image, ball.image])
+
+    def test_update_lives_draws_lives(self):
+        self.game._update_lives()
+
+        self.assertEqual(self.game._life_rects,
+                         [pygame.Rect(20, 780, 35, 10),
+                          pygame.Rect(60, 780, 35, 10)])
+        self.assertEqual(self.game.dirty_rects, self.game._life_rects)
+        self.assertEqual(self.game._lives_drawn, 3)
+
+    def test_update_lives_skips_when_unchanged(self):
+        self.game._update_lives()
+        self.game._screen.blits.reset_mock()
+        self.game.dirty_rects.clear()
+
+        self.game._update_lives()
+
+        self.game._screen.blits.assert_not_called()
+        self.assertEqual(self.game.dirty_rects, [])
+
+    def test_update_lives_redraws_when_drawn_over(self):
+        self.game._update_lives()
+        self.game._screen.blits.reset_mock()
+        self.game.dirty_rects[:] = [pygame.Rect(25, 785, 5, 5)]
+
+        self.game._update_lives()
+
+        self.assertEqual(self.game._screen.blits.call_count, 2)
+        self.assertEqual(len(self.game._life_rects), 2)
+
+    def test_update_lives_redraws_when_lives_change(self):
+        self.game._update_lives()
+        self.game.dirty_rects.clear()
+        self.game.lives = 2
+
+        self.game._update_lives()
+
+        self.assertEqual(self.game._life_rects,
+                         [pygame.Rect(20, 780, 35, 10)])
+        self.assertEqual(self.game._lives_drawn, 2)
+
+    def _sprite(self, rect):
+        return Mock(image=Mock(), rect=pygame.Rect(rect), visible=True)
+
+    def _static_sprite(self, rect):
+        sprite = self._sprite(rect)
+        self.game.static_sprites[sprite] = sprite.image, True
+        return sprite
+
+    def _erased(self):
+        # The rects erased with the background by the last draw.
+        erase, _ = self.game._screen.blits.call_args_list
+        return [dest for _, dest, _ in erase[0][0]]
+
+    def _drawn(self):
+        # The images drawn by the last draw, in order.
+        _, draw = self.game._screen.blits.call_args_list
+        return [image for image, _ in draw[0][0]]
+
+
+class TestArkanoid(TestCase):
+
+    def setUp(self):
+        # Create the program without running __init__(), which needs a
+        # display.
+        self.arkanoid = Arkanoid.__new__(Arkanoid)
+        self.arkanoid._scores_displayed = {}
+        self.arkanoid._score_surf = pygame.Surface((150, 20))
+        self.arkanoid._background = Mock()
+        self.arkanoid._screen = Mock()
+        self.arkanoid._screen.get_width.return_value = 600
+
+    @patch('arkanoid.game.ptext')
+    def test_display_score(self, mock_ptext):
+        rect = self.arkanoid._display_score(100, 35)
+
+        self.assertEqual(rect, self.arkanoid._screen.blit.return_value)
+        self.assertEqual(mock_ptext.draw.call_args[0][0], '100')
+        self.arkanoid._screen.blit.assert_called_with(
+            self.arkanoid._score_surf, (440, 35))
+
+    @patch('arkanoid.game.ptext')
+    def test_display_score_skips_displayed_value(self, mock_ptext):
+        self.arkanoid._display_score(100, 35)
+        self.arkanoid._screen.blit.reset_mock()
+        mock_ptext.reset_mock()
+
+        rect = self.arkanoid._display_score(100, 35)
+
+        self.assertIsNone(rect)
+        mock_ptext.draw.assert_not_called()
+        self.arkanoid._screen.blit.assert_not_called()
+
+    @patch('arkanoid.game.ptext')
+    def test_display_score_redraws_changed_value(self, mock_ptext):
+        self.arkanoid._display_score(100, 35)
+
+        rect = self.arkanoid._display_score(200, 35)
+
+        self.assertIsNotNone(rect)
+        self.assertEqual(mock_ptext.draw.call_args[0][0], '200')
+
+    @patch('arkanoid.game.ptext')
+    def test_display_score_caches_each_position(self, mock_ptext):
+        self.arkanoid._display_score(100, 35)
+
+        rect = self.arkanoid._display_score(100, 100)
+
+        self.assertIsNotNone(rect)
+        self.arkanoid._screen.blit.assert_called_with(
+            self.arkanoid._score_surf, (440, 100))
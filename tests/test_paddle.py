@@ -44,18 +44,15 @@ class TestPaddle(TestCase):
     @patch('arkanoid.sprites.paddle.pygame')
     def test_update_moves_when_in_area(self, mock_pygame, mock_load_png,
                                        mock_load_png_sequence):
-        mock_image, mock_rect, mock_area, mock_new_rect = (
-            Mock(), Mock(), Mock(), Mock())
-        mock_load_png.return_value = mock_image, mock_rect
-        mock_pygame.Rect.return_value = mock_area
-        mock_rect.move.return_value = mock_new_rect
-        mock_area.contains.return_value = True
+        mock_load_png.return_value = Mock(), Mock()
 
         paddle = Paddle()
+        paddle.area = pygame.Rect(0, 600, 600, 20)
+        paddle.rect = pygame.Rect(100, 600, 79, 20)
         paddle.move_left()
         paddle.update()
 
-        self.assertEqual(paddle.rect, mock_new_rect)
+        self.assertEqual(paddle.rect.topleft, (90, 600))
 
     @patch('arkanoid.sprites.paddle.load_png_sequence')
     @patch('arkanoid.sprites.paddle.load_png')
@@ -63,67 +60,93 @@ class TestPaddle(TestCase):
     def test_update_not_move_when_not_in_area(self, mock_pygame,
                                               mock_load_png,
                                               mock_load_png_sequence):
-        mock_image, mock_rect, mock_new_rect, mock_area_contains = (
-            Mock(), Mock(), Mock(), Mock())
-        mock_load_png.return_value = mock_image, mock_rect
-        mock_rect.move.return_value = mock_new_rect
-        mock_area_contains.return_value = False
+        mock_load_png.return_value = Mock(), Mock()
 
         paddle = Paddle()
-        paddle._area_contains = mock_area_contains
+        paddle.area = pygame.Rect(100, 600, 500, 20)
+        paddle.rect = pygame.Rect(100, 600, 79, 20)
         paddle.move_left()
         paddle.update()
 
-        self.assertEqual(paddle.rect, mock_rect)
+        self.assertEqual(paddle.rect.x, 100)
+
+    @patch('arkanoid.sprites.paddle.load_png_sequence')
+    @patch('arkanoid.sprites.paddle.load_png')
+    @patch('arkanoid.sprites.paddle.pygame')
+    def test_update_moves_to_edge_of_area(self, mock_pygame, mock_load_png,
+                                          mock_load_png_sequence):
+        mock_load_png.return_value = Mock(), Mock()
+
+        paddle = Paddle()
+        paddle.area = pygame.Rect(0, 600, 600, 20)
+        paddle.rect = pygame.Rect(5, 600, 79, 20)
+        paddle.move_left()
+        paddle.update()
+
+        self.assertEqual(paddle.rect.x, 0)
+
+    @patch('arkanoid.sprites.paddle.load_png_sequence')
+    @patch('arkanoid.sprites.paddle.load_png')
+    @patch('arkanoid.sprites.paddle.pygame')
+    def test_update_moves_to_right_edge_of_area(self, mock_pygame,
+                                                mock_load_png,
+                                                mock_load_png_sequence):
+        mock_load_png.return_value = Mock(), Mock()
+
+        paddle = Paddle()
+        paddle.area = pygame.Rect(0, 600, 600, 20)
+        paddle.rect = pygame.Rect(515, 600, 79, 20)
+        paddle.move_right()
+        paddle.update()
+
+        self.assertEqual(paddle.rect.right, 599)
 
     @patch('arkanoid.sprites.paddle.load_png_sequence')
     @patch('arkanoid.sprites.paddle.load_png')
     @patch('arkanoid.sprites.paddle.pygame')
     def test_move_left(self, mock_pygame, mock_load_png,
                        mock_load_png_sequence):
-        mock_image, mock_rect, mock_area = (Mock(), Mock(), Mock())
-        mock_load_png.return_value = mock_image, mock_rect
-        mock_pygame.Rect.return_value = mock_area
-        mock_area.contains.return_value = True
+        mock_load_png.return_value = Mock(), Mock()
 
         paddle = Paddle()
+        paddle.area = pygame.Rect(0, 600, 600, 20)
+        paddle.rect = pygame.Rect(100, 600, 79, 20)
         paddle.move_left()
         paddle.update()
 
-        mock_rect.move.assert_called_once_with(-10, 0)
+        self.assertEqual(paddle.rect.topleft, (90, 600))
 
     @patch('arkanoid.sprites.paddle.load_png_sequence')
     @patch('arkanoid.sprites.paddle.load_png')
     @patch('arkanoid.sprites.paddle.pygame')
     def test_move_right(self, mock_pygame, mock_load_png,
                         mock_load_png_sequence):
-        mock_image, mock_rect, mock_area = (Mock(), Mock(), Mock())
-        mock_load_png.return_value = mock_image, mock_rect
-        mock_pygame.Rect.return_value = mock_area
-        mock_area.contains.return_value = True
+        mock_load_png.return_value = Mock(), Mock()
 
         paddle = Paddle(speed=15)
+        paddle.area = pygame.Rect(0, 600, 600, 20)
+        paddle.rect = pygame.Rect(100, 600, 79, 20)
         paddle.move_right()
         paddle.update()
 
-        mock_rect.move.assert_called_once_with(15, 0)
+        self.assertEqual(paddle.rect.topleft, (115, 600))
 
     @patch('arkanoid.sprites.paddle.load_png_sequence')
     @patch('arkanoid.sprites.paddle.load_png')
     @patch('arkanoid.sprites.paddle.pygame')
     def test_stop(self, mock_pygame, mock_load_png,
                   mock_load_png_sequence):
-        mock_image, mock_rect, mock_area = (Mock(), Mock(), Mock())
-        mock_load_png.return_value = mock_image, mock_rect
-        mock_pygame.Rect.return_value = mock_area
-        mock_area.contains.return_value = True
+        mock_load_png.return_value = Mock(), Mock()
 
         paddle = Paddle()
+        paddle.area = pygame.Rect(0, 600, 600, 20)
+        paddle.rect = pygame.Rect(100, 600, 79, 20)
+        paddle.move_left()
         paddle.stop()
-        # Should not attempt to move the paddle now it is stopped.
+        # Should not move the paddle now it is stopped.
         paddle.update()
 
-        self.assertEqual(mock_rect.move.call_count, 0)
+        self.assertEqual(paddle.rect.topleft, (100, 600))
 
     @patch('arkanoid.sprites.paddle.load_png_sequence')
     @patch('arkanoid.sprites.paddle.load_png')
@@ -158,6 +181,15 @@ class TestPaddle(TestCase):
         self.assertEqual(angles[4], 295)
         self.assertEqual(angles[5], 320)
 
+    def test_bounce_strategy_paddle_ends(self):
+        paddle = pygame.Rect(100, 600, 60, 15)
+
+        left = Paddle.bounce_strategy(paddle, pygame.Rect(97, 602, 5, 5))
+        right = Paddle.bounce_strategy(paddle, pygame.Rect(158, 602, 5, 5))
+
+        self.assertEqual(round(math.degrees(left)), 220)
+        self.assertEqual(round(math.degrees(right)), 320)
+
 
 class TestLaserState(TestCase):
 
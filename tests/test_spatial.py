@@ -0,0 +1,85 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+import pygame
+
+from arkanoid.utils.spatial import SpatialHash
+
+
+class TestSpatialHash(TestCase):
+
+    def _create_sprite(self, left, top, width=43, height=21):
+        sprite = Mock()
+        sprite.rect = pygame.Rect(left, top, width, height)
+        return sprite
+
+    def test_query_returns_sprites_in_overlapping_cells(self):
+        near, far = self._create_sprite(0, 0), self._create_sprite(300, 300)
+        spatial_hash = SpatialHash(cell_size=44)
+        spatial_hash.insert(near)
+        spatial_hash.insert(far)
+
+        self.assertEqual(spatial_hash.query(pygame.Rect(40, 10, 10, 10)),
+                         [near])
+        self.assertEqual(spatial_hash.query(pygame.Rect(200, 200, 10, 10)),
+                         [])
+
+    def test_query_returns_sprite_spanning_cells_once(self):
+        sprite = self._create_sprite(30, 30)
+        spatial_hash = SpatialHash(cell_size=44)
+        spatial_hash.insert(sprite)
+
+        self.assertEqual(spatial_hash.query(pygame.Rect(0, 0, 100, 100)),
+                         [sprite])
+
+    def test_query_excludes_cell_at_right_edge(self):
+        sprite = self._create_sprite(44, 0)
+        spatial_hash = SpatialHash(cell_size=44)
+        spatial_hash.insert(sprite)
+
+        # The rect's right edge is exclusive, so it sits in cell (0, 0) only.
+        self.assertEqual(spatial_hash.query(pygame.Rect(0, 0, 44, 10)), [])
+
+    def test_query_within_single_cell(self):
+        sprite1, sprite2 = (self._create_sprite(0, 0),
+                            self._create_sprite(43, 0))
+        spatial_hash = SpatialHash(cell_size=44)
+        spatial_hash.insert(sprite1)
+        spatial_hash.insert(sprite2)
+
+        candidates = spatial_hash.query(pygame.Rect(10, 10, 10, 10))
+        candidates.clear()
+
+        # Both sprites occupy cell (0, 0), and the grid itself is unaffected
+        # by changes to the list returned.
+        self.assertEqual(spatial_hash.query(pygame.Rect(10, 10, 10, 10)),
+                         [sprite1, sprite2])
+        self.assertEqual(spatial_hash.query(pygame.Rect(100, 100, 10, 10)),
+                         [])
+
+    def test_remove(self):
+        sprite = self._create_sprite(0, 0)
+        spatial_hash = SpatialHash()
+        spatial_hash.insert(sprite)
+
+        spatial_hash.remove(sprite)
+
+        self.assertNotIn(sprite, spatial_hash)
+        self.assertEqual(spatial_hash.query(sprite.rect), [])
+
+    def test_remove_unknown_sprite(self):
+        spatial_hash = SpatialHash()
+
+        spatial_hash.remove(self._create_sprite(0, 0))
+
+        self.assertEqual(len(spatial_hash), 0)
+
+    def test_clear(self):
+        sprite = self._create_sprite(0, 0)
+        spatial_hash = SpatialHash()
+        spatial_hash.insert(sprite)
+
+        spatial_hash.clear()
+
+        self.assertNotIn(sprite, spatial_hash)
+        self.assertEqual(spatial_hash.query(sprite.rect), [])
@@ -3,7 +3,9 @@ from unittest import TestCase
 from unittest.mock import Mock
 from unittest.mock import patch
 
-from arkanoid.utils.util import (h_centre_pos,
+from arkanoid.utils.util import (_load_image,
+                                 h_centre_pos,
+                                 load_png,
                                  save_high_score,
                                  load_high_score)
 
@@ -22,6 +24,41 @@ class TestUtil(TestCase):
         if os.path.exists(self._high_score_file_backup):
             os.rename(self._high_score_file_backup, self._high_score_file)
 
+    @patch('arkanoid.utils.util.pygame')
+    def test_load_png_caches_image(self, mock_pygame):
+        mock_image = mock_pygame.image.load.return_value
+        mock_image.get_alpha.return_value = 255
+        _load_image.cache_clear()
+
+        try:
+            image1, rect1 = load_png('ball')
+            image2, rect2 = load_png('ball.png')
+        finally:
+            _load_image.cache_clear()
+
+        self.assertEqual(mock_pygame.image.load.call_count, 1)
+        self.assertIs(image1, image2)
+        self.assertEqual(image1, mock_image.convert_alpha.return_value)
+        self.assertEqual(mock_image.convert_alpha.return_value.get_rect
+                         .call_count, 2)
+
+    @patch('arkanoid.utils.util.pygame')
+    def test_load_png_converts_image_without_alpha(self, mock_pygame):
+        mock_image = mock_pygame.image.load.return_value
+        mock_image.get_alpha.return_value = None
+        _load_image.cache_clear()
+
+        try:
+            image, _ = load_png('ball')
+        finally:
+            _load_image.cache_clear()
+
+        self.assertEqual(image, mock_image.convert.return_value)
+
+    def test_load_png_file_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            load_png('does_not_exist')
+
     @patch('arkanoid.utils.util.pygame')
     def test_returns_left_pos_for_horizontal_centre(self, mock_pygame):
         mock_screen = Mock()